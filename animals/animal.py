@@ -7,6 +7,44 @@ from abc import ABC, abstractmethod
 from enum import Enum
 import random
 
+try:
+    import numpy as np
+    _rng = np.random.default_rng()
+except ImportError:  # pragma: no cover - numpy is in requirements.txt
+    np = None
+    _rng = None
+
+try:
+    from numba import njit as _njit
+except ImportError:  # numba is optional; fall back to plain Python
+    def _njit(**_kwargs):
+        def _wrap(func):
+            return func
+        return _wrap
+
+
+@_njit(cache=True)
+def _daily_update_kernel(hunger, ages, hunger_gain, health_decay, sick_rolls,
+                         sickness, happiness_penalty, health_delta, happiness_delta):
+    """
+    Compute daily health/happiness deltas for a batch of animals.
+
+    Pure array arithmetic so Numba can compile it to a tight loop; all
+    randomness is pre-generated and passed in. health_delta and
+    happiness_delta are filled in place.
+    """
+    for i in range(hunger.shape[0]):
+        new_hunger = hunger[i] + hunger_gain[i]
+        if new_hunger > 100.0:
+            new_hunger = 100.0
+        delta = 0.0
+        if new_hunger > 70.0:
+            delta -= health_decay[i]
+        if sick_rolls[i] < 0.1:
+            delta -= sickness[i]
+        health_delta[i] = delta
+        happiness_delta[i] = -((new_hunger * 0.1) + (ages[i] * 0.5) + happiness_penalty)
+
 class DietType(Enum):
     """Enumeration for animal diet types."""
     CARNIVORE = "carnivore"
@@ -40,12 +78,18 @@ class Animal(ABC):
             habitat: Preferred habitat
         """
         self._name = name
+        # Pre-normalized key for the enclosure name indexes, so stored
+        # entries never re-lower the name
+        self._name_key = name.lower()
         self._species = species
         self._age = age
         self.__health = 100.0  # Private attribute
         self.__hunger = 0.0    # Private attribute
         self.__happiness = 100.0  # Private attribute
         self._diet = diet
+        # Cached: enum .value is a descriptor lookup, and hot paths
+        # (diet tallies, compatibility checks) read this per animal
+        self._diet_value = diet.value
         self._habitat = habitat
     
     @abstractmethod
@@ -90,7 +134,71 @@ class Animal(ABC):
         # Small chance of random health issue
         if random.random() < 0.1:
             self.__health = max(0.0, self.__health - random.uniform(1.0, 3.0))
-    
+
+        # Species-specific daily behavior
+        self._daily_species_update()
+
+    def _daily_species_update(self) -> None:
+        """
+        Hook for species-specific daily behavior.
+
+        Subclasses override this instead of update_daily_status so the
+        base bookkeeping can also be applied in bulk (e.g. vectorized
+        across an enclosure) with the hook run per animal afterwards.
+        """
+        pass
+
+    @classmethod
+    def batch_update_daily(cls, animals, happiness_penalty: float = 0.0) -> None:
+        """
+        Apply the shared daily update to many animals in one pass.
+
+        Gathers hunger/age into arrays, computes all deltas with the
+        compiled kernel, and scatters them back through the protected
+        modifiers so clamping and observer notifications are preserved;
+        each animal's species hook runs afterwards. Falls back to
+        per-animal update_daily_status when numpy is unavailable.
+
+        Args:
+            animals: Animals to update
+            happiness_penalty: Extra happiness loss applied to every
+                animal (e.g. from a dirty enclosure)
+        """
+        count = len(animals)
+        if count == 0:
+            return
+
+        if np is None:
+            for animal in animals:
+                animal.update_daily_status()
+            if happiness_penalty:
+                for animal in animals:
+                    animal._modify_happiness(-happiness_penalty)
+            return
+
+        # Gather current state into arrays (struct-of-arrays view)
+        hunger = np.fromiter((a.hunger for a in animals), dtype=np.float64, count=count)
+        ages = np.fromiter((a.age for a in animals), dtype=np.float64, count=count)
+
+        # Pre-generate all randomness so the kernel stays pure arithmetic
+        hunger_gain = _rng.uniform(5.0, 15.0, count)
+        health_decay = _rng.uniform(2.0, 5.0, count)
+        sick_rolls = _rng.random(count)
+        sickness = _rng.uniform(1.0, 3.0, count)
+
+        health_delta = np.empty(count)
+        happiness_delta = np.empty(count)
+        _daily_update_kernel(hunger, ages, hunger_gain, health_decay, sick_rolls,
+                             sickness, happiness_penalty, health_delta, happiness_delta)
+
+        for i, animal in enumerate(animals):
+            animal._modify_hunger(float(hunger_gain[i]))
+            delta = float(health_delta[i])
+            if delta:
+                animal._modify_health(delta)
+            animal._modify_happiness(float(happiness_delta[i]))
+            animal._daily_species_update()
+
     # Property getters for encapsulated attributes
     @property
     def name(self) -> str:
@@ -126,7 +234,13 @@ class Animal(ABC):
     def diet(self) -> DietType:
         """Get diet type."""
         return self._diet
-    
+
+    @property
+    def diet_value(self) -> str:
+        """Get diet type's string value (cached)."""
+        return self._diet_value
+
+
     @property
     def habitat(self) -> str:
         """Get preferred habitat."""
@@ -174,7 +288,7 @@ class Animal(ABC):
             'health': self.__health,
             'hunger': self.__hunger,
             'happiness': self.__happiness,
-            'diet': self._diet.value,
+            'diet': self._diet_value,
             'habitat': self._habitat
         }
     
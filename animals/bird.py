@@ -74,12 +74,10 @@ class Bird(Animal):
         else:
             return f"{self._name} attempts to fly but can't get airborne."
     
-    def update_daily_status(self) -> None:
+    def _daily_species_update(self) -> None:
         """
-        Override daily status update with bird-specific behavior.
+        Bird-specific daily behavior.
         """
-        super().update_daily_status()
-        
         # Birds get extra hungry if they can fly
         if self._can_fly:
             self._modify_hunger(5.0)
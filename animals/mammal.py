@@ -69,12 +69,10 @@ class Mammal(Animal):
         """
         return f"{self._name} gives birth to live young!"
     
-    def update_daily_status(self) -> None:
+    def _daily_species_update(self) -> None:
         """
-        Override daily status update with mammal-specific behavior.
+        Mammal-specific daily behavior.
         """
-        super().update_daily_status()
-        
         # Mammals get extra happiness from social interaction
         if random.random() < 0.3:
             self._modify_happiness(2.0)
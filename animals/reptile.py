@@ -81,15 +81,13 @@ class Reptile(Animal):
         self._modify_happiness(15.0)
         return f"{self._name} basks in the sun to regulate body temperature."
     
-    def update_daily_status(self) -> None:
+    def _daily_species_update(self) -> None:
         """
-        Override daily status update with reptile-specific behavior.
+        Reptile-specific daily behavior.
         """
-        super().update_daily_status()
-        
         # Reptiles have slower metabolism
         self._modify_hunger(-5.0)  # They get hungry slower
-        
+
         # Chance to bask and improve happiness
         if random.random() < 0.4:
             self._modify_happiness(3.0)
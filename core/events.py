@@ -120,7 +120,7 @@ class HeatwaveEvent(WeatherEvent):
         
         # Affect all animals
         for enclosure in zoo._enclosures:
-            for animal in enclosure.animals:
+            for animal in enclosure.iter_animals():
                 # Animals lose health and happiness in heatwave
                 health_loss = random.uniform(5.0, 15.0)
                 happiness_loss = random.uniform(10.0, 25.0)
@@ -168,7 +168,7 @@ class PerfectWeatherEvent(WeatherEvent):
         
         # Boost animal happiness
         for enclosure in zoo._enclosures:
-            for animal in enclosure.animals:
+            for animal in enclosure.iter_animals():
                 happiness_gain = random.uniform(10.0, 20.0)
                 animal._modify_happiness(happiness_gain)
                 happiness_impact += happiness_gain
@@ -208,7 +208,7 @@ class RainyDayEvent(WeatherEvent):
         
         # Some animals love rain, some don't
         for enclosure in zoo._enclosures:
-            for animal in enclosure.animals:
+            for animal in enclosure.iter_animals():
                 if animal.species in ["Elephant", "Penguin"]:
                     # These animals enjoy rain
                     animal._modify_happiness(15.0)
@@ -224,7 +224,7 @@ class RainyDayEvent(WeatherEvent):
         # Enclosures get cleaner from rain
         for enclosure in zoo._enclosures:
             cleanliness_boost = random.uniform(5.0, 15.0)
-            enclosure._cleanliness = min(100.0, enclosure._cleanliness + cleanliness_boost)
+            enclosure._set_cleanliness(min(100.0, enclosure._cleanliness + cleanliness_boost))
         
         messages.append("💦 Rain naturally cleaned the enclosures!")
         
@@ -265,7 +265,7 @@ class AnimalBirthEvent(AnimalEvent):
         # Find enclosures with animals that could have babies
         potential_parents = []
         for enclosure in zoo._enclosures:
-            for animal in enclosure.animals:
+            for animal in enclosure.iter_animals():
                 if animal.age >= 2:  # Adults can have babies
                     potential_parents.append((enclosure, animal))
         
@@ -293,7 +293,7 @@ class AnimalBirthEvent(AnimalEvent):
                 self._occurred_today = True
                 
                 # Boost happiness for all animals in enclosure
-                for animal in enclosure.animals:
+                for animal in enclosure.iter_animals():
                     animal._modify_happiness(10.0)
                 
                 return {
@@ -338,7 +338,7 @@ class AnimalEscapeEvent(AnimalEvent):
         # Find animals that could escape
         potential_escapers = []
         for enclosure in zoo._enclosures:
-            for animal in enclosure.animals:
+            for animal in enclosure.iter_animals():
                 if animal.happiness < 40.0:  # Unhappy animals more likely to escape
                     potential_escapers.append((enclosure, animal))
         
@@ -513,7 +513,7 @@ class ProtestEvent(VisitorEvent):
             if enclosure.needs_cleaning():
                 poor_conditions = True
                 break
-            for animal in enclosure.animals:
+            for animal in enclosure.iter_animals():
                 if animal.happiness < 30.0:
                     poor_conditions = True
                     break
@@ -14,6 +14,7 @@ from animals.species.elephant import Elephant
 from animals.species.penguin import Penguin
 from core.exceptions import AnimalError
 from typing import Dict, Any
+import sys
 
 class AnimalFactory:
     """
@@ -49,7 +50,10 @@ class AnimalFactory:
         'bird': Bird,
         'reptile': Reptile,
     }
-    
+
+    # Memoized species list; cleared whenever the registry changes
+    _species_cache: list = None
+
     @classmethod
     def register_animal(cls, animal_type: str, animal_class: type) -> None:
         """
@@ -62,7 +66,9 @@ class AnimalFactory:
         if not issubclass(animal_class, Animal):
             raise AnimalError(f"Registered class must be a subclass of Animal")
         
-        cls._animal_registry[animal_type.lower()] = animal_class
+        # Interned key: registry lookups then short-circuit on identity
+        cls._animal_registry[sys.intern(animal_type.lower())] = animal_class
+        cls._species_cache = None
         print(f"✅ Registered new animal type: {animal_type} -> {animal_class.__name__}")
     
     @classmethod
@@ -82,8 +88,8 @@ class AnimalFactory:
         Raises:
             AnimalError: If animal type is unknown
         """
-        animal_type = animal_type.lower()
-        
+        animal_type = sys.intern(animal_type.lower())
+
         if animal_type not in cls._animal_registry:
             raise AnimalError(f"Unknown animal type: {animal_type}. Available: {list(cls._animal_registry.keys())}")
         
@@ -104,11 +110,16 @@ class AnimalFactory:
     def get_available_species(cls) -> list:
         """
         Get list of available animal species.
-        
+
+        The list is cached until a new species is registered, so repeat
+        callers get the same object back; treat it as read-only.
+
         Returns:
             List of available species names
         """
-        return list(cls._animal_registry.keys())
+        if cls._species_cache is None:
+            cls._species_cache = list(cls._animal_registry.keys())
+        return cls._species_cache
     
     @classmethod
     def create_from_config(cls, config: Dict[str, Any]) -> Animal:
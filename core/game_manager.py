@@ -10,6 +10,8 @@ from core.events import EventManager
 from core.factory import AnimalFactory
 from core.exceptions import ZooError, FinancialError, EnclosureError, CompatibilityError
 from typing import Optional, List, Dict
+from collections import deque
+from itertools import islice
 import random
 
 class ZooManager:
@@ -25,7 +27,10 @@ class ZooManager:
         self._day_count = 0
         self._health_monitor = HealthMonitor()
         self._event_manager = EventManager()
-        self._events_log: List[str] = []
+        # Bounded ring buffer: appends stay O(1) and old entries fall
+        # off automatically, so long games never grow the log unbounded
+        self._events_log: deque = deque(maxlen=256)
+        self._mutation_counter = 0
     
     def create_zoo(self, name: str, initial_funds: float = 50000.0) -> str:
         """
@@ -36,6 +41,7 @@ class ZooManager:
         """
         self._zoo = Zoo(name, initial_funds)
         self._day_count = 0
+        self._mutation_counter += 1
         self._log_event(f"Created new zoo: {name} with ${initial_funds:.2f}")
         
         summary = f"🏰 Created zoo: {name} with ${initial_funds:.2f}"
@@ -133,6 +139,7 @@ class ZooManager:
             print(f"✅ Add result: {success}")
             
             if success:
+                self._mutation_counter += 1
                 self._log_event(f"Added {name} the {animal_type} to {enclosure_name}")
                 msg = f"🎉 Successfully added {name} the {animal_type} to {enclosure_name}!"
                 print(msg)
@@ -164,6 +171,7 @@ class ZooManager:
         
         try:
             results = self._zoo.feed_animals(enclosure_name)
+            self._mutation_counter += 1
             self._log_event(f"Fed animals in {enclosure_name or 'all enclosures'}")
             
             # Provide user feedback
@@ -211,6 +219,7 @@ class ZooManager:
         
         cleaned_count = 0
         messages = []
+        self._mutation_counter += 1
         
         if enclosure_name:
             # Clean specific enclosure
@@ -258,6 +267,7 @@ class ZooManager:
         
         try:
             self._zoo.order_supplies()
+            self._mutation_counter += 1
             self._log_event("Purchased food supplies")
             msg = "🛒 Food supplies purchased successfully!"
             print(msg)
@@ -277,9 +287,23 @@ class ZooManager:
             return {}
         return self._zoo.get_zoo_status()
     
-    def get_health_alerts(self) -> List[str]:
-        """Get current health alerts."""
+    def get_health_alerts(self) -> List[tuple]:
+        """Get current health alerts as (name, species) pairs."""
         return self._health_monitor.get_critical_animals()
+
+    def get_dirty_enclosures(self) -> List[Dict]:
+        """
+        Get enclosures needing cleaning, without a full status build.
+
+        Returns:
+            List of dicts with 'name' and 'cleanliness' per dirty enclosure
+        """
+        if not self._zoo:
+            return []
+        return [
+            {'name': enclosure.name, 'cleanliness': enclosure.get_cleanliness()}
+            for enclosure in self._zoo.get_dirty_enclosures()
+        ]
     
     def advance_day(self) -> Dict:
         """
@@ -292,6 +316,7 @@ class ZooManager:
             raise ZooError("No zoo created yet")
         
         self._day_count += 1
+        self._mutation_counter += 1
         self._log_event(f"Advanced to day {self._day_count}")
         
         messages = []
@@ -353,7 +378,8 @@ class ZooManager:
         
         if critical_animals:
             messages.append("\n⚠️  Health Alerts:")
-            for alert in critical_animals:
+            for name, species in critical_animals:
+                alert = f"{name} the {species} has critical health"
                 print(f"   ⚠️  {alert}")
                 messages.append(f"⚠️  {alert}")
 
@@ -422,9 +448,20 @@ class ZooManager:
         self._events_log.append(f"Day {self._day_count}: {event}")
     
     def get_recent_events(self, count: int = 5) -> List[str]:
-        """Get recent game events."""
-        return self._events_log[-count:] if self._events_log else []
+        """Get the most recent game events, oldest first."""
+        log = self._events_log
+        return list(islice(log, max(0, len(log) - count), None))
     
+    @property
+    def mutation_counter(self) -> int:
+        """Counter bumped on every state mutation; lets UIs cache status."""
+        return self._mutation_counter
+
+    @property
+    def zoo_version(self) -> int:
+        """Cache key for memoized views of zoo state (see mutation_counter)."""
+        return self._mutation_counter
+
     @property
     def zoo(self) -> Optional[Zoo]:
         """Get current zoo instance."""
@@ -507,5 +544,5 @@ class ZooManager:
             "day": self._day_count,
             "funds": self._zoo._funds,
             "num_enclosures": len(self._zoo._enclosures),
-            "num_animals": sum(len(e.animals) for e in self._zoo._enclosures),
+            "num_animals": self._zoo.get_animal_count(),
         }
\ No newline at end of file
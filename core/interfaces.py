@@ -6,7 +6,10 @@ from abc import ABC, abstractmethod
 
 class ICleanable(ABC):
     """Interface for cleanable entities in the zoo."""
-    
+
+    __slots__ = ()  # stateless; lets implementors use __slots__ fully
+
+
     @abstractmethod
     def clean(self) -> None:
         """Perform cleaning action."""
@@ -24,7 +27,10 @@ class ICleanable(ABC):
 
 class IFeedable(ABC):
     """Interface for feedable entities."""
-    
+
+    __slots__ = ()
+
+
     @abstractmethod
     def feed(self, food_type: str) -> bool:
         """Feed the entity with specified food type."""
@@ -4,7 +4,7 @@ Demonstrates behavioral pattern for event-driven communication.
 """
 
 from abc import ABC, abstractmethod
-from typing import List, Dict, Any
+from typing import List, Dict, Any, Tuple
 from animals.animal import Animal, DietType  # ADD DietType IMPORT
 from core.exceptions import ZooError
 
@@ -73,8 +73,7 @@ class HealthMonitor(Observer):
     
     def _handle_health_critical(self, animal: 'ObservableAnimal', data: Dict[str, Any]) -> None:
         """Handle critical health alerts."""
-        animal_id = f"{animal.name}_{animal.species}"
-        self._critical_animals.add(animal_id)
+        self._critical_animals.add((animal.name, animal.species))
         
         alert_message = (
             f"🚨 CRITICAL HEALTH: {animal.name} the {animal.species} "
@@ -95,9 +94,7 @@ class HealthMonitor(Observer):
     
     def _handle_health_improved(self, animal: 'ObservableAnimal', data: Dict[str, Any]) -> None:
         """Handle health improvement notifications."""
-        animal_id = f"{animal.name}_{animal.species}"
-        if animal_id in self._critical_animals:
-            self._critical_animals.remove(animal_id)
+        self._critical_animals.discard((animal.name, animal.species))
         
         alert_message = (
             f"✅ HEALTH IMPROVED: {animal.name} the {animal.species} "
@@ -116,9 +113,7 @@ class HealthMonitor(Observer):
     
     def _handle_animal_died(self, animal: 'ObservableAnimal', data: Dict[str, Any]) -> None:
         """Handle animal death notifications."""
-        animal_id = f"{animal.name}_{animal.species}"
-        if animal_id in self._critical_animals:
-            self._critical_animals.remove(animal_id)
+        self._critical_animals.discard((animal.name, animal.species))
         
         alert_message = (
             f"💀 ANIMAL DIED: {animal.name} the {animal.species} "
@@ -135,8 +130,8 @@ class HealthMonitor(Observer):
         
         print(f"🔔 {alert_message}")
     
-    def get_critical_animals(self) -> List[str]:
-        """Get list of animals with critical health."""
+    def get_critical_animals(self) -> List[Tuple[str, str]]:
+        """Get list of (name, species) pairs with critical health."""
         return list(self._critical_animals)
     
     def get_alert_history(self) -> List[Dict]:
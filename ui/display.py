@@ -3,41 +3,200 @@ Enhanced Display Manager with colored output and formatted UI.
 Uses Colorama for cross-platform colored text.
 """
 
-import os
+import functools
+import shutil
 import sys
-from typing import Dict, List, Any
-from colorama import init, Fore, Back, Style
+from itertools import islice
+from typing import Dict, List, Any, Tuple
+try:
+    from colorama import init, Fore, Back, Style
+except ImportError:
+    # Headless/batch runs without colorama: blank out the escape codes
+    class _NullCodes:
+        def __getattr__(self, name: str) -> str:
+            return ""
+    Fore = Back = Style = _NullCodes()
+
+    def init(**kwargs) -> None:
+        pass
 
 # Initialize colorama for cross-platform colored text
 init(autoreset=True)
 
+# When stdout is piped/redirected, colorama strips escape codes anyway;
+# binding the constants to empty strings skips the concatenation work too
+_TTY = sys.stdout.isatty()
+
+def _c(code: str) -> str:
+    """Return the ANSI code on a terminal, an empty string otherwise."""
+    return code if _TTY else ""
+
+if not _TTY and hasattr(sys.stdout, "reconfigure"):
+    # Full block buffering for redirected output: batch writes kernel-side
+    sys.stdout.reconfigure(line_buffering=False, write_through=False)
+
+# Cursor-home + erase-display; colorama's init handles Windows VT support
+_CLEAR = "\x1b[H\x1b[2J"
+
+# Flat color constants: a single global load is cheaper than the
+# Display.COLORS dict subscript on hot paths; the COLORS dict below is
+# kept as a compatibility alias for external callers
+_C_SUCCESS = _c(Fore.GREEN)
+_C_ERROR = _c(Fore.RED)
+_C_WARNING = _c(Fore.YELLOW)
+_C_INFO = _c(Fore.CYAN)
+_C_MONEY = _c(Fore.GREEN + Style.BRIGHT)
+_C_HEALTH_GOOD = _c(Fore.GREEN)
+_C_HEALTH_WARNING = _c(Fore.YELLOW)
+_C_HEALTH_CRITICAL = _c(Fore.RED + Style.BRIGHT)
+_C_HEADER = _c(Fore.MAGENTA + Style.BRIGHT)
+_C_MENU_TITLE = _c(Fore.CYAN + Style.BRIGHT)
+_C_MENU_ITEM = _c(Fore.WHITE)
+_C_ANIMAL = _c(Fore.YELLOW)
+_C_ENCLOSURE = _c(Fore.BLUE)
+# Reset code for buffered output that bypasses the colorama proxy
+# (writelines): must be blanked on non-TTYs like the colors above
+_RESET = _c(Style.RESET_ALL)
+
+# Pre-encoded prefixes for the fixed-message helpers. Writing bytes to
+# the underlying buffer skips re-encoding the static prefix on every
+# call; only used for redirected output, where colorama stays out of
+# the way (on a TTY the text path keeps autoreset working).
+_RAW_OUT = getattr(sys.stdout, "buffer", None) if not _TTY else None
+_SUCCESS_B = (_C_SUCCESS + "✅ ").encode("utf-8")
+_ERROR_B = (_C_ERROR + "❌ ").encode("utf-8")
+_WARNING_B = (_C_WARNING + "⚠️  ").encode("utf-8")
+_INFO_B = (_C_INFO + "💡 ").encode("utf-8")
+
+# Pre-parsed template for the per-animal status lines; binding .format
+# once avoids re-parsing the format specs for every animal in the loop
+_ANIMAL_TMPL = ("  {c}{name} the {species}{r}\n"
+                "    {he} {hc}Health: {h:.1f}%{r} | "
+                "{pe} Happiness: {p:.1f}% | "
+                "{ue} Hunger: {u:.1f}%\n").format
+
+@functools.lru_cache(maxsize=8)
+def _sep(width: int) -> str:
+    """Cached header separator line for the few widths in use."""
+    return "═" * width
+
+@functools.lru_cache(maxsize=101)
+def _clean_style(bucket: int):
+    """Emoji/color pair for an integer cleanliness percentage."""
+    if bucket >= 80:
+        return "✨", _c(Fore.GREEN)
+    if bucket >= 50:
+        return "✅", _c(Fore.YELLOW)
+    return "🧹", _c(Fore.RED)
+
+@functools.lru_cache(maxsize=101)
+def _satisfaction_style(bucket: int):
+    """Emoji/color pair for an integer satisfaction percentage."""
+    if bucket >= 80:
+        return "😍", _c(Fore.GREEN)
+    if bucket >= 60:
+        return "😊", _c(Fore.YELLOW)
+    if bucket >= 40:
+        return "😐", _c(Fore.YELLOW)
+    return "😞", _c(Fore.RED)
+
+@functools.lru_cache(maxsize=256)
+def _supply_style(bucket: int):
+    """Emoji/color pair for an integer food supply amount in kg."""
+    if bucket > 50:
+        return "📦", _c(Fore.GREEN)
+    if bucket > 20:
+        return "📦", _c(Fore.YELLOW)
+    return "🆘", _c(Fore.RED)
+
+@functools.lru_cache(maxsize=32)
+def _money_prefix(context: str, color: str) -> str:
+    """Precompose the colored money prefix for a given context."""
+    if context:
+        return f"{color}💰 {context}: $"
+    return f"{color}💰 $"
+
+class _Framebuffer:
+    """
+    Tracks the last rendered frame and repaints only the changed lines.
+
+    Unchanged lines are not retransmitted: each differing line is
+    rewritten in place with a cursor-address + erase-line sequence. A
+    full clear is used on the first frame, when the terminal size
+    changes, when the frame shrinks, or when stdout is not a terminal.
+    """
+
+    _instances: List["_Framebuffer"] = []
+
+    def __init__(self):
+        self._last_lines: List[str] = []
+        self._last_size = None
+        _Framebuffer._instances.append(self)
+
+    def render(self, frame: str) -> None:
+        """Paint the frame, diffing against the previously rendered one."""
+        lines = frame.split("\n")
+        size = shutil.get_terminal_size(fallback=(0, 0))
+
+        if (not _TTY or size != self._last_size
+                or len(lines) < len(self._last_lines)):
+            self._last_size = size
+            self._last_lines = lines
+            sys.stdout.write(_CLEAR + frame)
+            return
+
+        last = self._last_lines
+        n_last = len(last)
+        out = []
+        for i, new_line in enumerate(lines[:-1]):
+            if i >= n_last or last[i] != new_line:
+                out.append(f"\x1b[{i + 1};1H\x1b[2K{new_line}")
+        # Always rewrite the final line so the cursor lands after it
+        # (it usually carries the input prompt)
+        out.append(f"\x1b[{len(lines)};1H\x1b[2K{lines[-1]}")
+        sys.stdout.writelines(out)
+        self._last_lines = lines
+
+    def invalidate(self) -> None:
+        """Force a full repaint on the next render."""
+        self._last_lines = []
+        self._last_size = None
+
+    @classmethod
+    def invalidate_all(cls) -> None:
+        """Invalidate every framebuffer (e.g. after a raw screen clear)."""
+        for fb in cls._instances:
+            fb.invalidate()
+
 class Display:
     """
     Enhanced display manager for formatted, colored CLI output.
     Maintains OOP separation - only handles presentation logic.
     """
     
-    # Color schemes for different message types
+    # Color schemes for different message types (aliases of the flat
+    # module-level constants above)
     COLORS = {
-        'success': Fore.GREEN,
-        'error': Fore.RED,
-        'warning': Fore.YELLOW,
-        'info': Fore.CYAN,
-        'money': Fore.GREEN + Style.BRIGHT,
-        'health_good': Fore.GREEN,
-        'health_warning': Fore.YELLOW,
-        'health_critical': Fore.RED + Style.BRIGHT,
-        'header': Fore.MAGENTA + Style.BRIGHT,
-        'menu_title': Fore.CYAN + Style.BRIGHT,
-        'menu_item': Fore.WHITE,
-        'animal': Fore.YELLOW,
-        'enclosure': Fore.BLUE,
+        'success': _C_SUCCESS,
+        'error': _C_ERROR,
+        'warning': _C_WARNING,
+        'info': _C_INFO,
+        'money': _C_MONEY,
+        'health_good': _C_HEALTH_GOOD,
+        'health_warning': _C_HEALTH_WARNING,
+        'health_critical': _C_HEALTH_CRITICAL,
+        'header': _C_HEADER,
+        'menu_title': _C_MENU_TITLE,
+        'menu_item': _C_MENU_ITEM,
+        'animal': _C_ANIMAL,
+        'enclosure': _C_ENCLOSURE,
     }
     
     @staticmethod
     def clear_screen() -> None:
-        """Clear the terminal screen."""
-        os.system('cls' if os.name == 'nt' else 'clear')
+        """Clear the terminal screen with a single ANSI write."""
+        _Framebuffer.invalidate_all()
+        sys.stdout.write(_CLEAR)
     
     @staticmethod
     def print_header(title: str, width: int = 60) -> None:
@@ -48,10 +207,13 @@ class Display:
             title: Header title
             width: Header width
         """
-        color = Display.COLORS['header']
-        print(f"\n{color}{'═' * width}")
-        print(f"{title.center(width)}")
-        print(f"{'═' * width}{Style.RESET_ALL}\n")
+        sys.stdout.write(Display.format_header(title, width))
+
+    @staticmethod
+    def format_header(title: str, width: int = 60) -> str:
+        """Compose a formatted header as a string without printing it."""
+        sep = _sep(width)
+        return f"\n{_C_HEADER}{sep}\n{title.center(width)}\n{sep}{Style.RESET_ALL}\n\n"
     
     @staticmethod
     def print_section(title: str, color: str = 'info') -> None:
@@ -63,62 +225,92 @@ class Display:
             color: Color key from COLORS
         """
         color_code = Display.COLORS.get(color, Fore.WHITE)
-        print(f"\n{color_code}{Style.BRIGHT}▶ {title}{Style.RESET_ALL}")
+        print(f"\n{color_code}{Style.BRIGHT}▶ {title}")
     
+    @staticmethod
+    def _print_prefixed(prefix_bytes: bytes, text: str) -> None:
+        """Emit a pre-encoded prefix plus message through the byte layer."""
+        sys.stdout.flush()  # keep ordering with pending text-layer output
+        _RAW_OUT.write(prefix_bytes + text.encode("utf-8") + b"\n")
+
     @staticmethod
     def print_success(message: str) -> None:
         """Print a success message."""
-        print(f"{Display.COLORS['success']}✅ {message}")
-    
+        if _RAW_OUT is not None:
+            Display._print_prefixed(_SUCCESS_B, message)
+        else:
+            print(f"{_C_SUCCESS}✅ {message}")
+
     @staticmethod
     def print_error(message: str) -> None:
         """Print an error message."""
-        print(f"{Display.COLORS['error']}❌ {message}")
-    
+        if _RAW_OUT is not None:
+            Display._print_prefixed(_ERROR_B, message)
+        else:
+            print(f"{_C_ERROR}❌ {message}")
+
     @staticmethod
     def print_warning(message: str) -> None:
         """Print a warning message."""
-        print(f"{Display.COLORS['warning']}⚠️  {message}")
-    
+        if _RAW_OUT is not None:
+            Display._print_prefixed(_WARNING_B, message)
+        else:
+            print(f"{_C_WARNING}⚠️  {message}")
+
     @staticmethod
     def print_info(message: str) -> None:
         """Print an info message."""
-        print(f"{Display.COLORS['info']}💡 {message}")
+        if _RAW_OUT is not None:
+            Display._print_prefixed(_INFO_B, message)
+        else:
+            print(f"{_C_INFO}💡 {message}")
     
     @staticmethod
     def print_money(amount: float, context: str = "") -> None:
         """Print money amount with formatting."""
-        color = Display.COLORS['money']
-        formatted_amount = f"${amount:,.2f}"
-        if context:
-            print(f"{color}💰 {context}: {formatted_amount}")
-        else:
-            print(f"{color}💰 {formatted_amount}")
+        # Single write keeps the colorama autoreset from splitting the line
+        sys.stdout.write(
+            _money_prefix(context, _C_MONEY) + format(amount, ",.2f") + "\n"
+        )
     
     @staticmethod
-    def print_animal_status(name: str, species: str, health: float, happiness: float, hunger: float) -> None:
+    def print_animal_status(name: str, species: str, health: float, happiness: float, hunger: float,
+                            buf: List[str] = None) -> None:
         """
         Print formatted animal status with color-coded health.
-        
+
         Args:
             name: Animal name
             species: Animal species
             health: Health percentage
             happiness: Happiness percentage
             hunger: Hunger percentage
+            buf: Optional buffer to append to instead of writing directly
+        """
+        line = Display._format_animal_status(name, species, health, happiness, hunger)
+        if buf is not None:
+            buf.append(line)
+        else:
+            sys.stdout.write(line)
+
+    @staticmethod
+    def _format_animal_status(name: str, species: str, health: float, happiness: float, hunger: float) -> str:
+        """
+        Format animal status as a string for buffered rendering.
+
+        Same layout as print_animal_status, but returns the text instead
+        of printing so callers can batch many animals into one write.
         """
-        # Determine health color
         if health >= 70:
-            health_color = Display.COLORS['health_good']
+            health_color = _C_HEALTH_GOOD
             health_emoji = "💚"
         elif health >= 40:
-            health_color = Display.COLORS['health_warning']
+            health_color = _C_HEALTH_WARNING
             health_emoji = "💛"
         else:
-            health_color = Display.COLORS['health_critical']
+            health_color = _C_HEALTH_CRITICAL
             health_emoji = "❤️"
-        
-        # Determine happiness emoji
+
         if happiness >= 80:
             happiness_emoji = "😄"
         elif happiness >= 60:
@@ -129,20 +321,20 @@ class Display:
             happiness_emoji = "😟"
         else:
             happiness_emoji = "😢"
-        
-        # Determine hunger emoji
+
         if hunger <= 20:
             hunger_emoji = "🍖"
         elif hunger <= 50:
             hunger_emoji = "🍽️"
         else:
             hunger_emoji = "🆘"
-        
-        animal_color = Display.COLORS['animal']
-        print(f"  {animal_color}{name} the {species}")
-        print(f"    {health_emoji} {health_color}Health: {health:.1f}%{Style.RESET_ALL} | "
-              f"{happiness_emoji} Happiness: {happiness:.1f}% | "
-              f"{hunger_emoji} Hunger: {hunger:.1f}%")
+
+        return _ANIMAL_TMPL(
+            c=_C_ANIMAL, name=name, species=species, r=_RESET,
+            he=health_emoji, hc=health_color, h=health,
+            pe=happiness_emoji, p=happiness,
+            ue=hunger_emoji, u=hunger,
+        )
     
     @staticmethod
     def print_zoo_status(status_data: Dict[str, Any]) -> None:
@@ -174,77 +366,63 @@ class Display:
         print(f"🐾 Total Animals: {status_data['animal_count']}")
         print(f"🏠 Total Enclosures: {status_data['enclosure_count']}")
         
-        # Visitor Satisfaction (calculated)
+        # Single pass over enclosures: render into a buffer while counting
+        # clean ones, so visitor satisfaction doesn't need a second scan
         total_animals = status_data['animal_count']
-        clean_enclosures = sum(1 for e in status_data['enclosures'] if e['cleanliness'] > 70)
-        total_enclosures = len(status_data['enclosures'])
-        
+        enclosures = status_data['enclosures']
+        total_enclosures = len(enclosures)
+        clean_enclosures = 0
+        render_buf = []
+
+        # Bind loop invariants to locals (LOAD_FAST in the loop body)
+        enclosure_color = _C_ENCLOSURE
+        _reset = _RESET
+
+        for enclosure in enclosures:
+            cleanliness = enclosure['cleanliness']
+            if cleanliness > 70:
+                clean_enclosures += 1
+
+            clean_emoji, clean_color = _clean_style(int(cleanliness))
+
+            render_buf.append(f"  {enclosure_color}{enclosure['name']} "
+                              f"({enclosure['animal_count']}/{enclosure['capacity']} animals){_reset}\n")
+            render_buf.append(f"    {clean_emoji} {clean_color}Cleanliness: {cleanliness:.1f}%{_reset} | "
+                              f"🏠 Type: {enclosure['type']}\n")
+
+            # Show first 3 animals; islice avoids allocating a slice copy
+            animals = enclosure['animals']
+            animal_total = len(animals)
+            for animal in islice(animals, 3):
+                Display.print_animal_status(
+                    animal['name'], animal['species'],
+                    animal['health'], animal['happiness'], animal['hunger'],
+                    buf=render_buf
+                )
+
+            if animal_total > 3:
+                render_buf.append(f"    ... and {animal_total - 3} more animals\n")
+
+        # Visitor Satisfaction (calculated)
         if total_enclosures > 0:
             cleanliness_score = (clean_enclosures / total_enclosures) * 100
             animal_density = total_animals / total_enclosures if total_enclosures > 0 else 0
             satisfaction = min(100, (cleanliness_score * 0.6 + min(animal_density * 10, 40)))
             
-            if satisfaction >= 80:
-                satisfaction_emoji = "😍"
-                satisfaction_color = Fore.GREEN
-            elif satisfaction >= 60:
-                satisfaction_emoji = "😊"
-                satisfaction_color = Fore.YELLOW
-            elif satisfaction >= 40:
-                satisfaction_emoji = "😐"
-                satisfaction_color = Fore.YELLOW
-            else:
-                satisfaction_emoji = "😞"
-                satisfaction_color = Fore.RED
-            
-            print(f"{satisfaction_emoji} {satisfaction_color}Visitor Satisfaction: {satisfaction:.1f}%{Style.RESET_ALL}")
-        
-        # Enclosure Status
+            satisfaction_emoji, satisfaction_color = _satisfaction_style(int(satisfaction))
+            print(f"{satisfaction_emoji} {satisfaction_color}Visitor Satisfaction: {satisfaction:.1f}%")
+
+        # Enclosure Status (rendered above; writelines skips the join
+        # so no large temporary string is built)
         Display.print_section("ENCLOSURE STATUS", 'enclosure')
-        for enclosure in status_data['enclosures']:
-            enclosure_color = Display.COLORS['enclosure']
-            cleanliness = enclosure['cleanliness']
-            
-            if cleanliness >= 80:
-                clean_emoji = "✨"
-                clean_color = Fore.GREEN
-            elif cleanliness >= 50:
-                clean_emoji = "✅"
-                clean_color = Fore.YELLOW
-            else:
-                clean_emoji = "🧹"
-                clean_color = Fore.RED
-            
-            print(f"  {enclosure_color}{enclosure['name']} "
-                  f"({enclosure['animal_count']}/{enclosure['capacity']} animals)")
-            print(f"    {clean_emoji} {clean_color}Cleanliness: {cleanliness:.1f}%{Style.RESET_ALL} | "
-                  f"🏠 Type: {enclosure['type']}")
-            
-            # Show animals in this enclosure
-            for animal in enclosure['animals'][:3]:  # Show first 3 animals
-                Display.print_animal_status(
-                    animal['name'], animal['species'],
-                    animal['health'], animal['happiness'], animal['hunger']
-                )
-            
-            if len(enclosure['animals']) > 3:
-                print(f"    ... and {len(enclosure['animals']) - 3} more animals")
-        
+        sys.stdout.writelines(render_buf)
+
         # Food Supplies
         Display.print_section("RESOURCE STATUS", 'warning')
         resources = status_data['resources']
         for food_type, amount in resources['food_supply'].items():
-            if amount > 50:
-                supply_emoji = "📦"
-                supply_color = Fore.GREEN
-            elif amount > 20:
-                supply_emoji = "📦"
-                supply_color = Fore.YELLOW
-            else:
-                supply_emoji = "🆘"
-                supply_color = Fore.RED
-            
-            print(f"  {supply_emoji} {supply_color}{food_type.title()}: {amount:.1f}kg{Style.RESET_ALL}")
+            supply_emoji, supply_color = _supply_style(int(amount))
+            print(f"  {supply_emoji} {supply_color}{food_type.title()}: {amount:.1f}kg")
     
     @staticmethod
     def print_menu(title: str, options: List[Dict[str, str]]) -> None:
@@ -255,19 +433,60 @@ class Display:
             title: Menu title
             options: List of option dictionaries with 'key', 'label', and optional 'description'
         """
-        Display.print_header(title, 50)
-        
+        sys.stdout.write(Display.format_menu(title, options))
+
+    @staticmethod
+    def format_menu(title: str, options: List[Dict[str, str]]) -> str:
+        """
+        Compose a formatted menu as a string without printing it.
+
+        Static menus can be rendered once at import and re-emitted with
+        a single write per frame.
+        """
+        parts = [Display.format_header(title, 50)]
+
+        # Bind loop invariants to locals (LOAD_FAST in the loop body)
+        _item = _C_MENU_ITEM
+        _bright = Style.BRIGHT
+        _reset = Style.RESET_ALL
+        _dim = Fore.LIGHTBLACK_EX
+
         for option in options:
             key = option['key']
             label = option['label']
             description = option.get('description', '')
-            
-            print(f"{Display.COLORS['menu_item']}{Style.BRIGHT}{key}.{Style.RESET_ALL} {label}")
+
+            parts.append(f"{_item}{_bright}{key}.{_reset} {label}\n")
             if description:
-                print(f"     {Fore.LIGHTBLACK_EX}{description}{Style.RESET_ALL}")
-        
-        print()
-    
+                parts.append(f"     {_dim}{description}{_reset}\n")
+
+        parts.append("\n")
+        return "".join(parts)
+
+    @staticmethod
+    def print_menu_iter(title: str, rows) -> None:
+        """
+        Print a menu from an iterator of (key, label, description) tuples.
+
+        Fuses row production and rendering into one pass: callers can
+        feed a generator directly instead of building an intermediate
+        list of option dicts.
+        """
+        parts = [Display.format_header(title, 50)]
+
+        _item = _C_MENU_ITEM
+        _bright = Style.BRIGHT
+        _reset = Style.RESET_ALL
+        _dim = Fore.LIGHTBLACK_EX
+
+        for key, label, description in rows:
+            parts.append(f"{_item}{_bright}{key}.{_reset} {label}\n")
+            if description:
+                parts.append(f"     {_dim}{description}{_reset}\n")
+
+        parts.append("\n")
+        sys.stdout.write("".join(parts))
+
     @staticmethod
     def print_event_summary(events: List[Dict]) -> None:
         """
@@ -281,26 +500,32 @@ class Display:
             return
         
         Display.print_section("TODAY'S SPECIAL EVENTS", 'header')
-        
+
+        # Bind loop invariants to locals (LOAD_FAST in the loop body)
+        _green_bright = Fore.GREEN + Style.BRIGHT
+        _red_bright = Fore.RED + Style.BRIGHT
+        _cyan = Fore.CYAN
+        _dim = Fore.LIGHTBLACK_EX
+
         for event_data in events:
             event = event_data['event']
             result = event_data['result']
-            
+
             # Color based on event severity
             if event.severity.value == 'positive':
-                event_color = Fore.GREEN + Style.BRIGHT
+                event_color = _green_bright
                 emoji = "✨"
             elif event.severity.value == 'negative':
-                event_color = Fore.RED + Style.BRIGHT
+                event_color = _red_bright
                 emoji = "⚠️"
             elif event.severity.value == 'critical':
-                event_color = Fore.RED + Style.BRIGHT
+                event_color = _red_bright
                 emoji = "🚨"
             else:
-                event_color = Fore.CYAN
+                event_color = _cyan
                 emoji = "ℹ️"
             
-            print(f"{emoji} {event_color}{event.name}{Style.RESET_ALL}")
+            print(f"{emoji} {event_color}{event.name}")
             print(f"   {event.description}")
             
             for message in result.get('messages', []):
@@ -323,51 +548,68 @@ class Display:
                     impacts.append(f"🎟️  -{-impact} visitors")
             
             if impacts:
-                print(f"   {Fore.LIGHTBLACK_EX}Impact: {', '.join(impacts)}{Style.RESET_ALL}")
+                print(f"   {_dim}Impact: {', '.join(impacts)}")
     
     @staticmethod
-    def print_health_alerts(critical_animals: List[str]) -> None:
+    def print_health_alerts(critical_animals: List[Tuple[str, str]]) -> None:
         """
         Print formatted health alerts.
-        
+
         Args:
-            critical_animals: List of animal IDs with critical health
+            critical_animals: List of (name, species) pairs with critical health
         """
         if not critical_animals:
             Display.print_success("No critical health issues!")
             return
-        
+
         Display.print_section("🚨 CRITICAL HEALTH ALERTS", 'error')
-        
-        for animal_id in critical_animals:
-            name, species = animal_id.split('_')
-            print(f"{Fore.RED}❌ {name} the {species} needs immediate medical attention!{Style.RESET_ALL}")
+
+        for name, species in critical_animals:
+            print(f"{Fore.RED}❌ {name} the {species} needs immediate medical attention!")
         
         Display.print_info("Feed animals and clean enclosures to improve health.")
     
     @staticmethod
-    def print_quick_stats(zoo_manager) -> None:
+    def format_quick_stats(zoo_manager) -> str:
         """
-        Print quick statistics line for header.
-        
+        Build the quick statistics line for the header.
+
         Args:
             zoo_manager: ZooManager instance
+
+        Returns:
+            Formatted stats line (empty when no zoo exists)
         """
         status = zoo_manager.get_zoo_status()
         if not status:
-            return
-        
+            return ""
+
         financials = status['financials']
-        funds_color = Display.COLORS['money']
-        animal_color = Display.COLORS['animal']
-        
-        print(f"{funds_color}💰 ${financials['funds']:,.2f}{Style.RESET_ALL} | "
-              f"{animal_color}🐾 {status['animal_count']} animals{Style.RESET_ALL} | "
-              f"🎟️ {status['total_visitors']:,} visitors | "
-              f"📅 Day {zoo_manager.day_count}")
+        funds_color = _C_MONEY
+        animal_color = _C_ANIMAL
+
+        return (f"{funds_color}💰 ${financials['funds']:,.2f}{Style.RESET_ALL} | "
+                f"{animal_color}🐾 {status['animal_count']} animals{Style.RESET_ALL} | "
+                f"🎟️ {status['total_visitors']:,} visitors | "
+                f"📅 Day {zoo_manager.day_count}\n")
+
+    @staticmethod
+    def print_quick_stats(zoo_manager) -> None:
+        """
+        Print quick statistics line for header.
+
+        Args:
+            zoo_manager: ZooManager instance
+        """
+        stats = Display.format_quick_stats(zoo_manager)
+        if stats:
+            sys.stdout.write(stats)
     
     @staticmethod
     def wait_for_enter(prompt: str = "Press Enter to continue...") -> None:
         """Wait for user to press Enter."""
-        print(f"\n{Fore.LIGHTBLACK_EX}{prompt}{Style.RESET_ALL}", end="")
-        input()
\ No newline at end of file
+        print(f"\n{Fore.LIGHTBLACK_EX}{prompt}", end="")
+        input()
+        # Reaching this pause means output scrolled the screen outside
+        # any framebuffer, so diffed repaints would land on stale lines
+        _Framebuffer.invalidate_all()
\ No newline at end of file
@@ -6,89 +6,174 @@ Maintains OOP separation - only calls backend methods.
 from core.game_manager import ZooManager
 from core.factory import AnimalFactory
 from core.exceptions import ZooError, FinancialError, CompatibilityError
-from ui.display import Display
-from colorama import Style, Fore
+from ui.display import Display, _Framebuffer
+try:
+    from colorama import Style, Fore
+except ImportError:
+    # Headless/batch runs without colorama: blank out the escape codes
+    class _NullCodes:
+        def __getattr__(self, name: str) -> str:
+            return ""
+    Style = Fore = _NullCodes()
 from typing import Optional, List, Dict
+from bisect import bisect_right
+import asyncio
+import os
 import sys
 
+# Prompt styling resolved once at import; every input() call used to
+# re-read the COLORS dict and the Style attribute chain
+_PROMPT = Display.COLORS['menu_item']
+_RESET = Style.RESET_ALL
+_PROMPT_FMT = f"{_PROMPT}{{}}{_RESET}".format
+
+# Pre-compiled color templates: one C-level format call per message
+# instead of rebuilding the escape-code concatenation in an f-string
+_CYAN_TMPL = (Fore.CYAN + "{}" + _RESET).format
+_FEED_OK_TMPL = ("   " + Fore.LIGHTGREEN_EX + "✓ {}" + _RESET + "\n").format
+_CLEAN_LINE_TMPL = ("  {}🧹 {} - {:.1f}% ({})" + _RESET).format
+
+# Menu index strings built once; menus are small and bounded, so the
+# enumerate loops can index this instead of calling str(i) per row
+_INDEX_STRS = [str(i) for i in range(64)]
+
+def _index_str(i: int) -> str:
+    """Menu index as a string, pre-materialized for small values."""
+    return _INDEX_STRS[i] if i < 64 else str(i)
+
+# Cleanliness urgency tiers: upper bound (exclusive) -> (color, label).
+# A bisect into the threshold list replaces the if/elif chain per row
+_URGENCY_TIERS = (
+    (Fore.RED, "URGENT"),
+    (Fore.YELLOW, "Needs cleaning"),
+    (Fore.LIGHTYELLOW_EX, "Could use cleaning"),
+)
+_URGENCY_THRESHOLDS = (20.0, 40.0)
+
+def _read_menu_key() -> str:
+    """
+    Read a single menu keystroke without waiting for Enter.
+
+    On a POSIX TTY the terminal is switched to cbreak mode for one read,
+    so numeric menu choices dispatch on the keypress itself. Anywhere
+    else (pipes, tests, other platforms) it falls back to a stripped
+    input() line.
+    """
+    if os.name == "posix" and sys.stdin.isatty():
+        import termios
+        import tty
+
+        fd = sys.stdin.fileno()
+        old_attrs = termios.tcgetattr(fd)
+        try:
+            tty.setcbreak(fd)
+            key = sys.stdin.read(1)
+        finally:
+            termios.tcsetattr(fd, termios.TCSADRAIN, old_attrs)
+        # Echo the key so the player sees what they pressed
+        sys.stdout.write(key + "\n")
+        return key
+    return input().strip()
+
+# Main menu banner built once: the emoji rows never change, so there is
+# no reason to re-multiply and re-concatenate them every redraw
+_HEADER_BANNER = (f"{Display.COLORS['header']}{'🦁' * 20}\n"
+                  f"      OZZOO - ZOO SIMULATION GAME\n"
+                  f"{'🦁' * 20}{_RESET}\n")
+
 class MenuSystem:
     """
     Enhanced CLI menu system with colored interface and formatted output.
     """
-    
+
+    # Static menus, rendered once at class load so each redraw is a
+    # single write instead of rebuilding ~30 small dicts per frame
+    _MAIN_MENU_OPTIONS = (
+        {'key': '1', 'label': '📊 View Detailed Zoo Status',
+         'description': 'Comprehensive zoo overview with statistics'},
+        {'key': '2', 'label': '🐾 Add New Animal',
+         'description': 'Purchase and place a new animal'},
+        {'key': '3', 'label': '🍽️  Feed Animals',
+         'description': 'Feed animals in specific or all enclosures'},
+        {'key': '4', 'label': '🧹 Clean Enclosures',
+         'description': 'Clean dirty habitats'},
+        {'key': '5', 'label': '📦 Buy Food & Supplies',
+         'description': 'Restock food and medicine'},
+        {'key': '6', 'label': '🌅 Advance to Next Day',
+         'description': 'Progress simulation and see events'},
+        {'key': '7', 'label': '📜 View Recent Events',
+         'description': 'See what happened recently'},
+        {'key': '8', 'label': '🚨 Health Alerts',
+         'description': 'Check animal health status'},
+        {'key': '9', 'label': '❌ Exit Game',
+         'description': 'Save and exit OzZoo'},
+    )
+    _MAIN_MENU_RENDERED = Display.format_menu("MAIN MENU", _MAIN_MENU_OPTIONS)
+
+    _FEED_MENU_OPTIONS = (
+        {'key': '1', 'label': 'Feed All Animals',
+         'description': 'Feed all animals in all enclosures'},
+        {'key': '2', 'label': 'Feed Specific Enclosure',
+         'description': 'Choose which enclosure to feed'},
+        {'key': '3', 'label': 'Back to Main Menu',
+         'description': 'Return to main menu'},
+    )
+    _FEED_MENU_RENDERED = Display.format_menu("FEEDING OPTIONS", _FEED_MENU_OPTIONS)
+
     def __init__(self, zoo_manager: ZooManager):
         """Initialize menu system with zoo manager."""
         self._zoo_manager = zoo_manager
         self._display = Display()
+        self._status_cache: Optional[Dict] = None
+        self._status_version = -1
+        self._main_menu_frame = _Framebuffer()
+        self._available_animals: Optional[List[str]] = None
+        self._available_animals_set: frozenset = frozenset()
+        # Single hash lookup per keypress instead of a 9-branch chain
+        self._dispatch = {
+            "1": self.display_zoo_status,
+            "2": self.display_add_animal_menu,
+            "3": self.display_feed_animals_menu,
+            "4": self.display_clean_enclosures_menu,
+            "5": self._buy_food_action,
+            "6": self._handle_advance_day,
+            "7": self.display_recent_events,
+            "8": self.display_health_alerts,
+            "9": self._exit_action,
+        }
+
+    def _cached_status(self) -> Dict:
+        """
+        Get zoo status, reusing the last snapshot when nothing changed.
+
+        The status dict is O(enclosures x animals) to build; menu flows
+        often ask for it several times in a single turn, so cache it
+        keyed on the manager's mutation counter.
+        """
+        version = self._zoo_manager.mutation_counter
+        if self._status_cache is None or version != self._status_version:
+            self._status_cache = self._zoo_manager.get_zoo_status()
+            self._status_version = version
+        return self._status_cache
     
     def display_main_menu(self) -> None:
-        """Display the enhanced main game menu."""
-        Display.clear_screen()
-        
-        # Print fancy header
-        print(f"{Display.COLORS['header']}{'🦁' * 20}")
-        print(f"      OZZOO - ZOO SIMULATION GAME")
-        print(f"{'🦁' * 20}{Style.RESET_ALL}")
-        
+        """Display the enhanced main game menu via a diffed repaint."""
+        frame = _HEADER_BANNER
+
         # Quick stats line
         if self._zoo_manager.zoo:
-            Display.print_quick_stats(self._zoo_manager)
-        
-        # Main menu options
-        menu_options = [
-            {
-                'key': '1',
-                'label': '📊 View Detailed Zoo Status',
-                'description': 'Comprehensive zoo overview with statistics'
-            },
-            {
-                'key': '2', 
-                'label': '🐾 Add New Animal',
-                'description': 'Purchase and place a new animal'
-            },
-            {
-                'key': '3',
-                'label': '🍽️  Feed Animals', 
-                'description': 'Feed animals in specific or all enclosures'
-            },
-            {
-                'key': '4',
-                'label': '🧹 Clean Enclosures',
-                'description': 'Clean dirty habitats'
-            },
-            {
-                'key': '5',
-                'label': '📦 Buy Food & Supplies',
-                'description': 'Restock food and medicine'
-            },
-            {
-                'key': '6', 
-                'label': '🌅 Advance to Next Day',
-                'description': 'Progress simulation and see events'
-            },
-            {
-                'key': '7',
-                'label': '📜 View Recent Events',
-                'description': 'See what happened recently'
-            },
-            {
-                'key': '8',
-                'label': '🚨 Health Alerts',
-                'description': 'Check animal health status'
-            },
-            {
-                'key': '9',
-                'label': '❌ Exit Game',
-                'description': 'Save and exit OzZoo'
-            }
-        ]
-        
-        Display.print_menu("MAIN MENU", menu_options)
-        print(f"{Display.COLORS['menu_item']}Enter your choice (1-9): {Style.RESET_ALL}", end="")
+            frame += Display.format_quick_stats(self._zoo_manager)
+
+        frame += self._MAIN_MENU_RENDERED
+        frame += _PROMPT_FMT("Enter your choice (1-9): ")
+
+        # Most of the frame (banner + menu body) is static between turns,
+        # so only the stats/prompt lines are usually retransmitted
+        self._main_menu_frame.render(frame)
     
     def display_zoo_status(self) -> None:
         """Display enhanced zoo status with colors and formatting."""
-        status = self._zoo_manager.get_zoo_status()
+        status = self._cached_status()
         Display.print_zoo_status(status)
         Display.wait_for_enter()
     
@@ -102,48 +187,50 @@ class MenuSystem:
         Display.clear_screen()
         Display.print_header("🐾 ADD NEW ANIMAL")
         
-        # Show available animals
+        # Show available animals (factory caches the list per registry
+        # version, so an identity check spots when to rebuild the set)
         available_animals = self._zoo_manager.get_available_animals()
+        if available_animals is not self._available_animals:
+            self._available_animals = available_animals
+            self._available_animals_set = frozenset(available_animals)
         Display.print_section("AVAILABLE SPECIES", 'info')
-        print(f"{Fore.CYAN}{', '.join(available_animals)}{Style.RESET_ALL}")
-        
+        print(_CYAN_TMPL(', '.join(available_animals)))
+
         try:
             # Get animal details with validation
-            animal_type = input(f"\n{Display.COLORS['menu_item']}Enter animal type: {Style.RESET_ALL}").strip()
-            if animal_type not in available_animals:
+            animal_type = input(_PROMPT_FMT("\nEnter animal type: ")).strip()
+            if animal_type not in self._available_animals_set:
                 Display.print_error(f"Unknown animal type. Available: {', '.join(available_animals)}")
                 Display.wait_for_enter()
                 return
             
-            name = input(f"{Display.COLORS['menu_item']}Enter animal name: {Style.RESET_ALL}").strip()
+            name = input(_PROMPT_FMT("Enter animal name: ")).strip()
             if not name:
                 Display.print_error("Animal name cannot be empty!")
                 Display.wait_for_enter()
                 return
             
-            age = int(input(f"{Display.COLORS['menu_item']}Enter animal age (years): {Style.RESET_ALL}"))
+            age = int(input(_PROMPT_FMT("Enter animal age (years): ")))
             if age < 0 or age > 50:
                 Display.print_error("Please enter a reasonable age (0-50)!")
                 Display.wait_for_enter()
                 return
             
             # Show available enclosures
-            status = self._zoo_manager.get_zoo_status()
+            status = self._cached_status()
             Display.print_section("AVAILABLE ENCLOSURES", 'enclosure')
             
-            enclosure_options = []
-            for i, enclosure in enumerate(status['enclosures'], 1):
-                occupancy = f"{enclosure['animal_count']}/{enclosure['capacity']}"
-                cleanliness = "✨" if enclosure['cleanliness'] > 70 else "✅" if enclosure['cleanliness'] > 40 else "🧹"
-                enclosure_options.append({
-                    'key': str(i),
-                    'label': f"{enclosure['name']} ({occupancy} animals) {cleanliness}",
-                    'description': f"Type: {enclosure['type']}, Cleanliness: {enclosure['cleanliness']:.1f}%"
-                })
+            # Fused resolve-and-render: the generator feeds the menu
+            # writer directly, skipping the intermediate list of dicts
+            Display.print_menu_iter("SELECT ENCLOSURE", (
+                (_index_str(i),
+                 f"{e['name']} ({e['animal_count']}/{e['capacity']} animals) "
+                 f"{'✨' if e['cleanliness'] > 70 else '✅' if e['cleanliness'] > 40 else '🧹'}",
+                 f"Type: {e['type']}, Cleanliness: {e['cleanliness']:.1f}%")
+                for i, e in enumerate(status['enclosures'], 1)
+            ))
             
-            Display.print_menu("SELECT ENCLOSURE", enclosure_options)
-            
-            enclosure_choice = input(f"{Display.COLORS['menu_item']}Select enclosure (number): {Style.RESET_ALL}").strip()
+            enclosure_choice = input(_PROMPT_FMT("Select enclosure (number): ")).strip()
             
             # Find enclosure
             selected_enclosure = None
@@ -188,30 +275,12 @@ class MenuSystem:
         Display.clear_screen()
         Display.print_header("🍽️  FEED ANIMALS")
         
-        status = self._zoo_manager.get_zoo_status()
+        status = self._cached_status()
         
-        menu_options = [
-            {
-                'key': '1',
-                'label': 'Feed All Animals',
-                'description': 'Feed all animals in all enclosures'
-            },
-            {
-                'key': '2', 
-                'label': 'Feed Specific Enclosure',
-                'description': 'Choose which enclosure to feed'
-            },
-            {
-                'key': '3',
-                'label': 'Back to Main Menu',
-                'description': 'Return to main menu'
-            }
-        ]
-        
-        Display.print_menu("FEEDING OPTIONS", menu_options)
+        sys.stdout.write(self._FEED_MENU_RENDERED)
         
         try:
-            choice = input(f"{Display.COLORS['menu_item']}Enter your choice (1-3): {Style.RESET_ALL}").strip()
+            choice = input(_PROMPT_FMT("Enter your choice (1-3): ")).strip()
             
             if choice == "1":
                 results = self._zoo_manager.feed_animals()
@@ -229,34 +298,44 @@ class MenuSystem:
         Display.wait_for_enter()
     
     def _display_feeding_results(self, results: Dict) -> None:
-        """Display formatted feeding results."""
+        """Display formatted feeding results from ZooManager.feed_animals."""
         if not results:
             Display.print_error("No feeding results available!")
             return
-        
-        total_fed = 0
+
+        total_fed = results.get('total_fed', 0)
         Display.print_section("FEEDING RESULTS", 'info')
-        
-        for enclosure, enclosure_results in results.items():
-            fed_count = len(enclosure_results.get('successful', []))
-            total_fed += fed_count
-            
-            if fed_count > 0:
-                Display.print_success(f"Fed {fed_count} animals in {enclosure}")
-                
-                # Show some individual feeding results
-                successful_feeds = enclosure_results.get('successful', [])[:2]
-                for feed_msg in successful_feeds:
-                    print(f"   {Fore.LIGHTGREEN_EX}✓ {feed_msg}{Style.RESET_ALL}")
-        
+
+        # Show a few of the manager's per-animal messages in one write
+        messages = results.get('messages', [])[:4]
+        if messages:
+            sys.stdout.write("".join(
+                _FEED_OK_TMPL(feed_msg) for feed_msg in messages
+            ))
+
         if total_fed == 0:
             Display.print_error("No animals were fed. Check food supplies!")
         else:
             Display.print_success(f"Successfully fed {total_fed} animals total!")
+
+    def _display_feeding_results_single(self, enclosure_name: str, results: Dict) -> None:
+        """
+        Display feeding results for a single enclosure.
+
+        Fast path for the feed-one-enclosure flow: no wrapper dict, no
+        per-enclosure loop — just the one count and its summary line.
+        """
+        fed_count = results.get('total_fed', 0) if results else 0
+        Display.print_section("FEEDING RESULTS", 'info')
+
+        if fed_count > 0:
+            Display.print_success(f"Fed {fed_count} animals in {enclosure_name}")
+        else:
+            Display.print_error("No animals were fed. Check food supplies!")
     
     def _display_enclosure_selection_menu(self, action: str) -> None:
         """Display menu for selecting enclosures for various actions."""
-        status = self._zoo_manager.get_zoo_status()
+        status = self._cached_status()
         
         Display.print_section("SELECT ENCLOSURE", 'enclosure')
         
@@ -264,14 +343,14 @@ class MenuSystem:
         for i, enclosure in enumerate(status['enclosures'], 1):
             animal_count = enclosure['animal_count']
             enclosure_options.append({
-                'key': str(i),
+                'key': _index_str(i),
                 'label': f"{enclosure['name']} ({animal_count} animals)",
                 'description': f"Type: {enclosure['type']}, Cleanliness: {enclosure['cleanliness']:.1f}%"
             })
         
         Display.print_menu(f"SELECT ENCLOSURE TO {action.upper()}", enclosure_options)
         
-        enclosure_choice = input(f"{Display.COLORS['menu_item']}Select enclosure (number): {Style.RESET_ALL}").strip()
+        enclosure_choice = input(_PROMPT_FMT("Select enclosure (number): ")).strip()
         
         try:
             enclosure_index = int(enclosure_choice) - 1
@@ -280,7 +359,7 @@ class MenuSystem:
                 
                 if action == "feed":
                     results = self._zoo_manager.feed_animals(selected_enclosure)
-                    self._display_feeding_results({selected_enclosure: results})
+                    self._display_feeding_results_single(selected_enclosure, results)
                 elif action == "clean":
                     cleaned = self._zoo_manager.clean_enclosures(selected_enclosure)
                     if cleaned > 0:
@@ -302,33 +381,23 @@ class MenuSystem:
         Display.clear_screen()
         Display.print_header("🧹 CLEAN ENCLOSURES")
         
-        status = self._zoo_manager.get_zoo_status()
-        
-        # Find dirty enclosures
-        dirty_enclosures = [
-            enclosure for enclosure in status['enclosures'] 
-            if enclosure['needs_cleaning']
-        ]
-        
+        # Incrementally maintained set: O(dirty), no scan over all enclosures
+        dirty_enclosures = self._zoo_manager.get_dirty_enclosures()
+
         if not dirty_enclosures:
             Display.print_success("All enclosures are clean! 🎉")
             Display.wait_for_enter()
             return
         
         Display.print_section("DIRTY ENCLOSURES NEEDING CLEANING", 'warning')
+        lines = []
         for enclosure in dirty_enclosures:
             cleanliness = enclosure['cleanliness']
-            if cleanliness < 20:
-                clean_color = Fore.RED
-                urgency = "URGENT"
-            elif cleanliness < 40:
-                clean_color = Fore.YELLOW
-                urgency = "Needs cleaning"
-            else:
-                clean_color = Fore.LIGHTYELLOW_EX
-                urgency = "Could use cleaning"
-            
-            print(f"  {clean_color}🧹 {enclosure['name']} - {cleanliness:.1f}% ({urgency}){Style.RESET_ALL}")
+            clean_color, urgency = _URGENCY_TIERS[bisect_right(_URGENCY_THRESHOLDS, cleanliness)]
+            lines.append(_CLEAN_LINE_TMPL(clean_color, enclosure['name'], cleanliness, urgency))
+        
+        # One write for the whole list instead of a print per enclosure
+        sys.stdout.write("\n".join(lines) + "\n")
         
         menu_options = [
             {
@@ -351,7 +420,7 @@ class MenuSystem:
         Display.print_menu("CLEANING OPTIONS", menu_options)
         
         try:
-            choice = input(f"{Display.COLORS['menu_item']}Enter your choice (1-3): {Style.RESET_ALL}").strip()
+            choice = input(_PROMPT_FMT("Enter your choice (1-3): ")).strip()
             
             if choice == "1":
                 cleaned = self._zoo_manager.clean_enclosures()
@@ -378,15 +447,16 @@ class MenuSystem:
     
     def display_recent_events(self) -> None:
         """Display enhanced recent events view."""
-        events = self._zoo_manager.get_recent_events()
+        # The manager's ring buffer already hands back just the tail
+        events = self._zoo_manager.get_recent_events(10)
         Display.clear_screen()
         Display.print_header("📜 RECENT EVENTS")
-        
+
         if not events:
             Display.print_info("No recent events to display.")
         else:
-            for event in events[-10:]:  # Show last 10 events
-                print(f"• {event}")
+            # One write for the whole list
+            sys.stdout.write("".join(f"• {event}\n" for event in events))
         
         Display.wait_for_enter()
     
@@ -398,40 +468,33 @@ class MenuSystem:
             True if should continue, False if should exit
         """
         try:
-            if choice == "1":
-                self.display_zoo_status()
-            elif choice == "2":
-                self.display_add_animal_menu()
-            elif choice == "3":
-                self.display_feed_animals_menu()
-            elif choice == "4":
-                self.display_clean_enclosures_menu()
-            elif choice == "5":
-                if self._zoo_manager.buy_food():
-                    Display.print_success("Food supplies purchased!")
-                else:
-                    Display.print_error("Failed to purchase food!")
-                Display.wait_for_enter()
-            elif choice == "6":
-                self._handle_advance_day()
-            elif choice == "7":
-                self.display_recent_events()
-            elif choice == "8":
-                self.display_health_alerts()
-            elif choice == "9":
-                Display.print_success("Thanks for playing OzZoo! 👋")
-                return False
-            else:
+            handler = self._dispatch.get(choice)
+            if handler is None:
                 Display.print_error("Invalid choice! Please enter 1-9.")
                 Display.wait_for_enter()
-            
-            return True
-            
+                return True
+
+            # Only _exit_action returns False; the rest return None
+            return handler() is not False
+
         except Exception as e:
             Display.print_error(f"Unexpected error: {e}")
             Display.wait_for_enter()
             return True
-    
+
+    def _buy_food_action(self) -> None:
+        """Handle the buy-food menu entry."""
+        if self._zoo_manager.buy_food():
+            Display.print_success("Food supplies purchased!")
+        else:
+            Display.print_error("Failed to purchase food!")
+        Display.wait_for_enter()
+
+    def _exit_action(self) -> bool:
+        """Handle the exit menu entry."""
+        Display.print_success("Thanks for playing OzZoo! 👋")
+        return False
+
     def _handle_advance_day(self) -> None:
         """Handle day advancement with enhanced display."""
         try:
@@ -464,27 +527,145 @@ class MenuSystem:
         
         Display.wait_for_enter()
     
-    def run(self) -> None:
-        """Run the enhanced main game loop."""
+    async def _read_menu_key_async(self) -> str:
+        """
+        Await a single menu keystroke without blocking the event loop.
+
+        The terminal sits in cbreak mode while the loop watches the
+        stdin descriptor, so the keypress dispatches immediately but the
+        wait itself stays interruptible — Ctrl-C aborts it at the await
+        instead of stranding a worker thread in a raw read (which kept
+        the process alive and the terminal in no-echo mode until one
+        more key was pressed).
+        """
+        import termios
+        import tty
+
+        loop = asyncio.get_running_loop()
+        fd = sys.stdin.fileno()
+        old_attrs = termios.tcgetattr(fd)
+        tty.setcbreak(fd)
+        try:
+            future = loop.create_future()
+
+            def _on_readable():
+                if not future.done():
+                    future.set_result(None)
+
+            try:
+                loop.add_reader(fd, _on_readable)
+            except OSError:
+                # Selector can't watch this descriptor: a blocking read
+                # on the main thread still honors Ctrl-C
+                key = sys.stdin.read(1)
+            else:
+                try:
+                    await future
+                finally:
+                    loop.remove_reader(fd)
+                key = sys.stdin.read(1)
+        finally:
+            termios.tcsetattr(fd, termios.TCSADRAIN, old_attrs)
+        # Echo the key so the player sees what they pressed
+        sys.stdout.write(key + "\n")
+        return key
+
+    async def _read_stdin_line(self) -> str:
+        """
+        Await one line from stdin without blocking the event loop.
+
+        On POSIX the event loop watches the stdin descriptor directly
+        (loop.add_reader), so other tasks can run while the player
+        thinks; elsewhere, or when stdin has no real descriptor, the
+        read is pushed to a worker thread.
+        """
+        loop = asyncio.get_running_loop()
+        try:
+            fd = sys.stdin.fileno()
+        except (AttributeError, OSError, ValueError):
+            fd = None
+
+        if fd is None or os.name != "posix":
+            return await loop.run_in_executor(None, sys.stdin.readline)
+
+        future = loop.create_future()
+
+        def _on_readable():
+            loop.remove_reader(fd)
+            if not future.done():
+                future.set_result(sys.stdin.readline())
+
+        try:
+            loop.add_reader(fd, _on_readable)
+        except OSError:
+            # Regular files (e.g. `python main.py < commands.txt`) can't
+            # be watched by the selector; read in a worker thread instead
+            return await loop.run_in_executor(None, sys.stdin.readline)
+        try:
+            return await future
+        finally:
+            loop.remove_reader(fd)
+
+    async def run_async(self) -> None:
+        """
+        Run the main game loop on an asyncio event loop.
+
+        The loop stays free while awaiting top-level menu input, leaving
+        room for background tasks (autosave, prefetch) to be scheduled
+        alongside it. Sub-menu prompts still read synchronously.
+        """
+        # GNU readline buffers stdin in C and adds line editing/history
+        # to every input() call; optional, so a missing module is fine
+        try:
+            import readline
+            readline.set_history_length(100)
+        except ImportError:
+            pass
+
+        if hasattr(sys.stdin, "reconfigure"):
+            sys.stdin.reconfigure(line_buffering=True)
+
         # Initial zoo creation
         if not self._zoo_manager.zoo:
             self._create_initial_zoo()
-        
+
         # Main game loop
         running = True
         while running:
             try:
                 self.display_main_menu()
-                choice = input().strip()
-                running = self.handle_main_menu_choice(choice)
-                
+                if sys.stdin.isatty():
+                    if os.name == "posix":
+                        # Single keystroke, no Enter needed; the loop
+                        # watches stdin so the wait stays interruptible
+                        choice = await self._read_menu_key_async()
+                    else:
+                        # No descriptor watching here; plain blocking
+                        # input keeps Ctrl-C responsive
+                        choice = _read_menu_key()
+                    if not choice:  # EOF
+                        break
+                    running = self.handle_main_menu_choice(choice)
+                else:
+                    line = await self._read_stdin_line()
+                    if not line:  # EOF: treat like exiting the game
+                        break
+                    running = self.handle_main_menu_choice(line.strip())
+
             except KeyboardInterrupt:
                 Display.print_success("\n\nThanks for playing OzZoo! 👋")
                 break
             except Exception as e:
                 Display.print_error(f"Unexpected error: {e}")
                 Display.wait_for_enter()
-    
+
+    def run(self) -> None:
+        """Run the enhanced main game loop (sync entry point)."""
+        try:
+            asyncio.run(self.run_async())
+        except KeyboardInterrupt:
+            Display.print_success("\n\nThanks for playing OzZoo! 👋")
+
     def _create_initial_zoo(self) -> None:
         """Create initial zoo setup with enhanced interface."""
         Display.clear_screen()
@@ -493,7 +674,7 @@ class MenuSystem:
         
         while True:
             try:
-                zoo_name = input(f"\n{Display.COLORS['menu_item']}Enter your zoo name: {Style.RESET_ALL}").strip()
+                zoo_name = input(_PROMPT_FMT("\nEnter your zoo name: ")).strip()
                 if not zoo_name:
                     Display.print_error("Zoo name cannot be empty!")
                     continue
@@ -1,8 +1,10 @@
-import streamlit as st
 from core.game_manager import ZooManager
 
 def run_streamlit_app():
     """Run OzZoo game in a Streamlit UI."""
+    # Deferred: streamlit is a heavy import and only needed when this
+    # frontend actually runs, not when the ui package is imported
+    import streamlit as st
 
     st.set_page_config(page_title="OzZoo Simulation Game", page_icon="🦁")
 
@@ -14,6 +16,16 @@ def run_streamlit_app():
 
     zoo = st.session_state.zoo_manager
 
+    # Status and species lists are rebuilt on every widget interaction
+    # otherwise; keying on the version counter makes reruns cache hits
+    @st.cache_data
+    def _status_snapshot(version: int, _zoo=zoo):
+        return _zoo.get_zoo_status()
+
+    @st.cache_data
+    def _available_animals(version: int, _zoo=zoo):
+        return _zoo.get_available_animals()
+
     st.title("🦁 OzZoo Simulation Game")
     st.caption("A zoo management simulation built with Python OOP")
 
@@ -33,41 +45,59 @@ def run_streamlit_app():
 
     # Show current zoo summary
     st.subheader(f"📅 Day {st.session_state.day}")
-    st.write(zoo.get_zoo_status())
+    st.write(_status_snapshot(zoo.zoo_version))
 
     # ---- ACTION BUTTONS ----
     st.divider()
     st.subheader("🎯 Actions")
 
-    col1, col2, col3 = st.columns(3)
-
-    if col1.button("🐾 Add Animal"):
+    # on_click callbacks mutate state exactly once per click; the rerun
+    # then renders from session_state and the version-keyed caches
+    # instead of re-running the action inside the button branch
+    def _show_add_animal_cb():
         st.session_state.show_add_animal = True
 
-    if col2.button("🍽️ Feed Animals"):
-        result = zoo.feed_animals()
-        st.success("Animals fed successfully!")
+    def _feed_cb():
+        st.session_state.last_feed = zoo.feed_animals()
 
-    if col3.button("🧹 Clean Enclosures"):
-        cleaned = zoo.clean_enclosures()
-        st.info(f"Cleaned {cleaned} enclosures!")
+    def _clean_cb():
+        st.session_state.last_clean = zoo.clean_enclosures()
 
-    if st.button("🌅 Advance to Next Day"):
-        result = zoo.advance_day()
+    def _advance_cb():
+        zoo.advance_day()
         st.session_state.day += 1
-        st.success(f"Advanced to Day {st.session_state.day}")
+        st.session_state.last_advance = st.session_state.day
+
+    col1, col2, col3 = st.columns(3)
+
+    col1.button("🐾 Add Animal", on_click=_show_add_animal_cb)
+    col2.button("🍽️ Feed Animals", on_click=_feed_cb)
+    col3.button("🧹 Clean Enclosures", on_click=_clean_cb)
+    st.button("🌅 Advance to Next Day", on_click=_advance_cb)
+
+    # Render the last action results from session state
+    last_feed = st.session_state.get("last_feed")
+    if last_feed is not None:
+        st.success(f"Fed {last_feed.get('total_fed', 0)} animals!")
+
+    last_clean = st.session_state.get("last_clean")
+    if last_clean is not None:
+        st.info(f"Cleaned {last_clean.get('cleaned_count', 0)} enclosures!")
+
+    if st.session_state.get("last_advance") is not None:
+        st.success(f"Advanced to Day {st.session_state.last_advance}")
 
     # ---- ADD ANIMAL POPUP ----
     if st.session_state.get("show_add_animal", False):
         st.subheader("🐾 Add a New Animal")
 
-        available_animals = zoo.get_available_animals()
+        available_animals = _available_animals(zoo.zoo_version)
         animal_type = st.selectbox("Choose species:", available_animals)
         name = st.text_input("Animal name:")
         age = st.number_input("Age (years)", min_value=0, max_value=50, value=1)
 
         # Get enclosure list
-        status = zoo.get_zoo_status()
+        status = _status_snapshot(zoo.zoo_version)
         enclosure_names = [e["name"] for e in status["enclosures"]]
         selected_enclosure = st.selectbox("Choose enclosure:", enclosure_names)
 
@@ -20,7 +20,14 @@ if not zoo._zoo:
         st.success(msg)
 else:
     st.subheader(f"📅 Day {zoo._day_count}")
-    st.json(zoo.get_zoo_status())
+
+    # Re-serializing the full status dict on every rerun is wasted work
+    # when nothing changed; the version counter keys the cached copy
+    @st.cache_data
+    def _status_snapshot(version: int, _zoo=zoo):
+        return _zoo.get_zoo_status()
+
+    st.json(_status_snapshot(zoo.zoo_version))
 
     # --- Actions ---
     st.subheader("🎯 Actions")
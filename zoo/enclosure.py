@@ -5,8 +5,13 @@ Enclosure class managing animal habitats with ICleanable interface.
 from core.interfaces import ICleanable
 from core.exceptions import EnclosureError, CompatibilityError, ResourceError
 from animals.animal import Animal
-from typing import List, Optional, Dict
+from typing import Dict, Iterator, List, Optional, Tuple
+from collections import Counter
+import logging
 import random
+import sys
+
+logger = logging.getLogger(__name__)
 
 class Enclosure(ICleanable):
     """
@@ -20,7 +25,18 @@ class Enclosure(ICleanable):
         _cleanliness (float): Cleanliness level 0-100
         _compatible_species (List[str]): Species that can coexist
     """
-    
+
+    # Fixed attribute set: saves per-instance dict space and speeds up
+    # the attribute access in the daily-update hot loops
+    __slots__ = ('_name', '_name_key', '_capacity', '_enclosure_type', '_animals',
+                 '_animals_by_key', '_species_counts', '_diet_counts',
+                 '_dominant_food', '_cleanliness', '_compatible_species',
+                 '_compatible_species_set', '_dirty_callback',
+                 '_count_callback', '_info_cache')
+
+    # Cleanliness level below which the enclosure needs cleaning
+    _CLEANING_THRESHOLD = 30.0
+
     def __init__(self, name: str, capacity: int, enclosure_type: str, compatible_species: List[str] = None):
         """
         Initialize enclosure with basic properties.
@@ -31,12 +47,33 @@ class Enclosure(ICleanable):
             enclosure_type: Type of enclosure
             compatible_species: List of compatible species
         """
-        self._name = name
+        # Interned: the name is hashed into dicts on every lookup that
+        # routes through it, so share one copy with a cached hash
+        self._name = sys.intern(name)
+        # Pre-normalized key for the zoo's name index
+        self._name_key = sys.intern(name.lower())
         self._capacity = capacity
         self._enclosure_type = enclosure_type
         self._animals = []
+        # Lowercased name -> list index, kept in step with _animals so
+        # name removal and species checks skip the scans
+        self._animals_by_key: Dict[str, int] = {}
+        self._species_counts: Counter = Counter()
+        self._diet_counts: Counter = Counter()
+        # Preferred feed for the current inhabitants; recomputed on
+        # add/remove so feed cycles don't re-derive it per enclosure
+        self._dominant_food = "seeds"
         self._cleanliness = 100.0
         self._compatible_species = compatible_species or []
+        # Frozen membership set; the list above stays for info output
+        self._compatible_species_set = frozenset(self._compatible_species)
+        # Set by the owning Zoo to keep its dirty-enclosure set current
+        self._dirty_callback = None
+        # Set by the owning Zoo to keep its running animal count current
+        self._count_callback = None
+        # Cached get_enclosure_info snapshot; dropped on any mutation so
+        # unchanged enclosures share one dict across status builds
+        self._info_cache = None
     
     @property
     def name(self) -> str:
@@ -49,24 +86,62 @@ class Enclosure(ICleanable):
         return len(self._animals)
     
     @property
-    def animals(self) -> List[Animal]:
-        """Get copy of animals list (encapsulation protection)."""
-        return self._animals.copy()
+    def animals(self) -> Tuple[Animal, ...]:
+        """Get read-only snapshot of animals (encapsulation protection)."""
+        return tuple(self._animals)
+
+    def iter_animals(self) -> Iterator[Animal]:
+        """Iterate over animals without copying the underlying list."""
+        return iter(self._animals)
+
+    @property
+    def diet_counts(self) -> Dict[str, int]:
+        """Get the live diet tally (diet value -> count); read-only."""
+        return self._diet_counts
+
+    @property
+    def dominant_food(self) -> str:
+        """Get the food type suited to the current inhabitants."""
+        return self._dominant_food
+
+    def _update_dominant_food(self) -> None:
+        """Recompute the preferred feed from the diet tally."""
+        # Counter returns 0 for missing keys, so no .get defaults needed
+        if self._diet_counts['carnivore']:
+            self._dominant_food = "meat"
+        elif self._diet_counts['herbivore']:
+            self._dominant_food = "vegetables"
+        else:
+            self._dominant_food = "seeds"  # Omnivores, unknown, or empty
     
     # ICleanable interface implementation
     def clean(self) -> None:
         """Clean the enclosure to maximum cleanliness."""
         old_cleanliness = self._cleanliness
-        self._cleanliness = 100.0
-        print(f"🧹 Cleaned {self._name}. Cleanliness: {old_cleanliness:.1f}% → 100.0%")
-    
+        self._set_cleanliness(100.0)
+        logger.debug("🧹 Cleaned %s. Cleanliness: %.1f%% → 100.0%%", self._name, old_cleanliness)
+
     def get_cleanliness(self) -> float:
         """Get current cleanliness level."""
         return self._cleanliness
-    
+
     def needs_cleaning(self) -> bool:
         """Check if enclosure needs cleaning."""
-        return self._cleanliness < 30.0
+        return self._cleanliness < self._CLEANING_THRESHOLD
+
+    def _set_cleanliness(self, value: float) -> None:
+        """
+        Update cleanliness, notifying the owner when dirty state flips.
+
+        Keeps the zoo's dirty-enclosure set current without scanning
+        every enclosure on each query.
+        """
+        was_dirty = self._cleanliness < self._CLEANING_THRESHOLD
+        self._cleanliness = value
+        self._info_cache = None
+        is_dirty = value < self._CLEANING_THRESHOLD
+        if is_dirty != was_dirty and self._dirty_callback is not None:
+            self._dirty_callback(self, is_dirty)
     
     def add_animal(self, animal: Animal) -> bool:
         """
@@ -90,7 +165,7 @@ class Enclosure(ICleanable):
         
         # Check species compatibility
         if not self._is_animal_compatible(animal):
-            existing_species = [a.species for a in self._animals]
+            existing_species = list(self._species_counts)
             raise CompatibilityError(
                 f"Cannot add {animal.species} to enclosure with {existing_species}",
                 animal.species,
@@ -99,10 +174,17 @@ class Enclosure(ICleanable):
         
         # Check habitat suitability
         if animal.habitat != self._enclosure_type:
-            print(f"⚠️  Warning: {animal.species} prefers {animal.habitat} but is in {self._enclosure_type}")
+            logger.warning("⚠️  %s prefers %s but is in %s", animal.species, animal.habitat, self._enclosure_type)
         
+        self._animals_by_key[animal._name_key] = len(self._animals)
         self._animals.append(animal)
-        print(f"✅ Added {animal.name} the {animal.species} to {self._name}")
+        self._species_counts[animal.species] += 1
+        self._diet_counts[animal.diet_value] += 1
+        self._update_dominant_food()
+        self._info_cache = None
+        if self._count_callback is not None:
+            self._count_callback(1)
+        logger.debug("✅ Added %s the %s to %s", animal.name, animal.species, self._name)
         return True
     
     def remove_animal(self, animal_name: str) -> Optional[Animal]:
@@ -115,12 +197,37 @@ class Enclosure(ICleanable):
         Returns:
             Removed animal or None if not found
         """
-        for i, animal in enumerate(self._animals):
-            if animal.name.lower() == animal_name.lower():
-                removed_animal = self._animals.pop(i)
-                print(f"❌ Removed {removed_animal.name} from {self._name}")
-                return removed_animal
-        return None
+        key = animal_name.lower()
+        idx = self._animals_by_key.pop(key, None)
+        if idx is None:
+            # Duplicate names shadow each other in the index (add_animal
+            # doesn't enforce uniqueness), so fall back to a scan to keep
+            # every same-named animal removable
+            idx = next((i for i, a in enumerate(self._animals)
+                        if a._name_key == key), None)
+            if idx is None:
+                return None
+
+        # Swap-pop: move the last animal into the vacated slot so
+        # removal is O(1); ordering within an enclosure carries no meaning
+        removed_animal = self._animals[idx]
+        last = self._animals.pop()
+        if idx != len(self._animals):
+            self._animals[idx] = last
+            self._animals_by_key[last._name_key] = idx
+        self._species_counts[removed_animal.species] -= 1
+        if self._species_counts[removed_animal.species] == 0:
+            del self._species_counts[removed_animal.species]
+        diet_value = removed_animal.diet_value
+        self._diet_counts[diet_value] -= 1
+        if self._diet_counts[diet_value] == 0:
+            del self._diet_counts[diet_value]
+        self._update_dominant_food()
+        self._info_cache = None
+        if self._count_callback is not None:
+            self._count_callback(-1)
+        logger.debug("❌ Removed %s from %s", removed_animal.name, self._name)
+        return removed_animal
     
     def _is_animal_compatible(self, new_animal: Animal) -> bool:
         """
@@ -135,35 +242,36 @@ class Enclosure(ICleanable):
         if not self._animals:
             return True  # Empty enclosure, any animal is compatible
         
-        print(f"🔍 Compatibility check for {new_animal.name} the {new_animal.species}")
-        print(f"   Enclosure: {self._name}, Type: {self._enclosure_type}")
-        print(f"   Compatible species: {self._compatible_species}")
-        print(f"   Current animals: {[a.species for a in self._animals]}")
-        
-        # Check against compatible species list (if specified)
-        if self._compatible_species:
-            if new_animal.species not in self._compatible_species:
-                print(f"❌ {new_animal.species} not in compatible species list: {self._compatible_species}")
+        # Guard the diagnostics: no formatting cost unless DEBUG is on
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("🔍 Compatibility check for %s the %s", new_animal.name, new_animal.species)
+            logger.debug("   Enclosure: %s, Type: %s", self._name, self._enclosure_type)
+            logger.debug("   Compatible species: %s", self._compatible_species)
+            logger.debug("   Current animals: %s", list(self._species_counts))
+
+        # Check against compatible species set (if specified)
+        if self._compatible_species_set:
+            if new_animal.species not in self._compatible_species_set:
+                logger.debug("❌ %s not in compatible species list: %s", new_animal.species, self._compatible_species)
                 return False
             else:
-                print(f"✅ {new_animal.species} is in compatible species list")
-        
-        # Basic compatibility rules
-        for existing_animal in self._animals:
-            # Carnivores shouldn't be with potential prey (except same species)
-            if (existing_animal.diet.value == "carnivore" and 
-                new_animal.diet.value != "carnivore" and
-                existing_animal.species != new_animal.species):
-                print(f"❌ Carnivore conflict: {existing_animal.species} (carnivore) vs {new_animal.species} (not carnivore)")
-                return False
-            
-            if (new_animal.diet.value == "carnivore" and 
-                existing_animal.diet.value != "carnivore" and
-                existing_animal.species != new_animal.species):
-                print(f"❌ Carnivore conflict: {new_animal.species} (carnivore) vs {existing_animal.species} (not carnivore)")
-                return False
-        
-        print(f"✅ {new_animal.species} is compatible with enclosure {self._name}")
+                logger.debug("✅ %s is in compatible species list", new_animal.species)
+
+        # Basic compatibility rule, as one constant-time test on the
+        # maintained tallies: mixing carnivores with potential prey is
+        # rejected in either direction, unless everything (including the
+        # newcomer) is the same species
+        is_carn = new_animal.diet_value == "carnivore"
+        carnivores = self._diet_counts.get("carnivore", 0)
+        same_species_only = (len(self._species_counts) == 1
+                             and new_animal.species in self._species_counts)
+        if not same_species_only and (len(self._animals) > carnivores if is_carn else carnivores > 0):
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug("❌ Carnivore conflict: %s (%s) vs existing %s",
+                             new_animal.species, new_animal.diet_value, list(self._species_counts))
+            return False
+
+        logger.debug("✅ %s is compatible with enclosure %s", new_animal.species, self._name)
         return True
     
     def feed_animals(self, food_type: str, resource_manager) -> Dict[str, List[str]]:
@@ -184,6 +292,7 @@ class Enclosure(ICleanable):
         }
         
         total_food_needed = len(self._animals) * 2.0  # 2kg per animal
+        self._info_cache = None
         
         try:
             # Use food from resource manager
@@ -200,22 +309,25 @@ class Enclosure(ICleanable):
         
         return results
     
-    def update_daily_status(self) -> None:
+    def update_daily_status(self, dirt: Optional[float] = None) -> None:
         """
         Update enclosure and animal status for a new day.
+
+        The per-animal bookkeeping is delegated to the batch API on
+        Animal, which processes the whole enclosure in one pass.
+
+        Args:
+            dirt: Pre-drawn dirt rate per animal; the owning Zoo batches
+                these for all enclosures. Drawn locally when omitted.
         """
         # Animals make enclosure dirtier
-        dirt_per_animal = random.uniform(2.0, 8.0)
-        self._cleanliness = max(0.0, self._cleanliness - (len(self._animals) * dirt_per_animal))
-        
-        # Update all animals
-        for animal in self._animals:
-            animal.update_daily_status()
-        
+        self._info_cache = None
+        dirt_per_animal = random.uniform(2.0, 8.0) if dirt is None else dirt
+        self._set_cleanliness(max(0.0, self._cleanliness - (len(self._animals) * dirt_per_animal)))
+
         # Cleanliness affects animal happiness
-        if self._cleanliness < 50.0:
-            for animal in self._animals:
-                animal._modify_happiness(-5.0)
+        happiness_penalty = 5.0 if self._cleanliness < 50.0 else 0.0
+        Animal.batch_update_daily(self._animals, happiness_penalty)
     
     def get_occupancy(self) -> float:
         """
@@ -229,18 +341,24 @@ class Enclosure(ICleanable):
     def get_enclosure_info(self) -> Dict:
         """
         Get comprehensive enclosure information.
-        
+
+        The snapshot is cached until the enclosure mutates, so repeated
+        status builds reuse the same dict for untouched enclosures
+        (structural sharing); callers must treat it as read-only.
+
         Returns:
             Dictionary with enclosure details
         """
-        return {
-            'name': self._name,
-            'type': self._enclosure_type,
-            'capacity': self._capacity,
-            'animal_count': len(self._animals),
-            'occupancy_percent': self.get_occupancy(),
-            'cleanliness': self._cleanliness,
-            'needs_cleaning': self.needs_cleaning(),
-            'compatible_species': self._compatible_species,  # ADD THIS LINE
-            'animals': [animal.get_info() for animal in self._animals]
-        }
\ No newline at end of file
+        if self._info_cache is None:
+            self._info_cache = {
+                'name': self._name,
+                'type': self._enclosure_type,
+                'capacity': self._capacity,
+                'animal_count': len(self._animals),
+                'occupancy_percent': self.get_occupancy(),
+                'cleanliness': self._cleanliness,
+                'needs_cleaning': self.needs_cleaning(),
+                'compatible_species': self._compatible_species,  # ADD THIS LINE
+                'animals': [animal.get_info() for animal in self._animals]
+            }
+        return self._info_cache
\ No newline at end of file
@@ -4,19 +4,62 @@ Demonstrates encapsulation and exception handling.
 """
 
 from core.exceptions import ResourceError, FinancialError
-from typing import Dict
+from enum import IntEnum
+from types import MappingProxyType
+from typing import Dict, Mapping, Optional, Tuple, Union
+import logging
+
+try:
+    import numpy as np
+except ImportError:  # pragma: no cover - numpy is in requirements.txt
+    np = None
+
+logger = logging.getLogger(__name__)
+
+
+class Food(IntEnum):
+    """Built-in food types; values index the supply array."""
+    MEAT = 0
+    FISH = 1
+    SEEDS = 2
+    FRUITS = 3
+    VEGETABLES = 4
+    INSECTS = 5
+
+
+class Medicine(IntEnum):
+    """Built-in medicine types; values index the supply array."""
+    VACCINE = 0
+    ANTIBIOTICS = 1
+    PAIN_RELIEVER = 2
+    VITAMINS = 3
+
+
+# Resolved once at import: lowercased name -> array index
+_FOOD_INDEX: Dict[str, int] = {food.name.lower(): food.value for food in Food}
+_MEDICINE_INDEX: Dict[str, int] = {med.name.lower(): med.value for med in Medicine}
+
+_INITIAL_FOOD = (100.0, 50.0, 200.0, 150.0, 100.0, 20.0)  # kg, in Food order
+_INITIAL_MEDICINE = (10, 15, 20, 25)  # units, in Medicine order
 
 class ResourceManager:
     """
     Manages zoo resources including food, medicine, and finances.
     
     Attributes:
-        _food_supply (Dict[str, float]): Food types and quantities in kg
-        _medicine_supply (Dict[str, int]): Medicine types and quantities
+        _food_supply: Quantities in kg for built-in types, indexed by Food
+        _medicine_supply: Quantities for built-in types, indexed by Medicine
+        _extra_food (Dict[str, float]): Supplies for custom food types
+        _extra_medicine (Dict[str, int]): Supplies for custom medicine types
         _funds (float): Available funds in dollars
         _daily_costs (float): Accumulated daily costs
     """
-    
+
+    __slots__ = ('_food_supply', '_medicine_supply', '_extra_food',
+                 '_extra_medicine', '_food_view', '_medicine_view',
+                 '_funds', '_daily_costs', '_daily_income')
+
+
     def __init__(self, initial_funds: float = 100000.0):
         """
         Initialize resource manager with starting supplies.
@@ -24,22 +67,23 @@ class ResourceManager:
         Args:
             initial_funds: Starting amount of money
         """
-        self._food_supply = {
-            "meat": 100.0,      # kg
-            "fish": 50.0,       # kg
-            "seeds": 200.0,     # kg
-            "fruits": 150.0,    # kg
-            "vegetables": 100.0,# kg
-            "insects": 20.0     # kg
-        }
-        
-        self._medicine_supply = {
-            "vaccine": 10,
-            "antibiotics": 15,
-            "pain_reliever": 20,
-            "vitamins": 25
-        }
-        
+        # Supplies for the built-in types live in flat arrays indexed by
+        # the Food/Medicine enums, so hot-path lookups are an integer
+        # index instead of a string hash (plain lists when numpy is
+        # unavailable). Types ordered beyond that fixed set go in the
+        # overflow dicts.
+        if np is not None:
+            self._food_supply = np.array(_INITIAL_FOOD, dtype=np.float64)
+            self._medicine_supply = np.array(_INITIAL_MEDICINE, dtype=np.int64)
+        else:
+            self._food_supply = list(_INITIAL_FOOD)
+            self._medicine_supply = list(_INITIAL_MEDICINE)
+        self._extra_food: Dict[str, float] = {}
+        self._extra_medicine: Dict[str, int] = {}
+        # Lazily rebuilt read-only views served by the supply properties
+        self._food_view: Optional[Mapping[str, float]] = None
+        self._medicine_view: Optional[Mapping[str, int]] = None
+
         self._funds = initial_funds
         self._daily_costs = 0.0
         self._daily_income = 0.0
@@ -50,14 +94,44 @@ class ResourceManager:
         return self._funds
     
     @property
-    def food_supply(self) -> Dict[str, float]:
-        """Get copy of food supply (encapsulation protection)."""
-        return self._food_supply.copy()
-    
+    def food_supply(self) -> Mapping[str, float]:
+        """Get read-only view of food supply (encapsulation protection)."""
+        if self._food_view is None:
+            supply = {food.name.lower(): float(self._food_supply[food.value]) for food in Food}
+            supply.update(self._extra_food)
+            self._food_view = MappingProxyType(supply)
+        return self._food_view
+
     @property
-    def medicine_supply(self) -> Dict[str, int]:
-        """Get copy of medicine supply (encapsulation protection)."""
-        return self._medicine_supply.copy()
+    def medicine_supply(self) -> Mapping[str, int]:
+        """Get read-only view of medicine supply (encapsulation protection)."""
+        if self._medicine_view is None:
+            supply = {med.name.lower(): int(self._medicine_supply[med.value]) for med in Medicine}
+            supply.update(self._extra_medicine)
+            self._medicine_view = MappingProxyType(supply)
+        return self._medicine_view
+
+    def get_total_food(self) -> float:
+        """Get total food on hand across all types, in kg."""
+        if np is not None:
+            total = float(self._food_supply.sum())
+        else:
+            total = sum(self._food_supply)
+        return total + sum(self._extra_food.values())
+
+    @staticmethod
+    def _food_key(food_type: Union[Food, str]) -> Tuple[Optional[int], str]:
+        """Resolve a food name or Food enum to (array index, display name)."""
+        if isinstance(food_type, Food):
+            return food_type.value, food_type.name.lower()
+        return _FOOD_INDEX.get(food_type), food_type
+
+    @staticmethod
+    def _medicine_key(medicine_type: Union[Medicine, str]) -> Tuple[Optional[int], str]:
+        """Resolve a medicine name or Medicine enum to (array index, display name)."""
+        if isinstance(medicine_type, Medicine):
+            return medicine_type.value, medicine_type.name.lower()
+        return _MEDICINE_INDEX.get(medicine_type), medicine_type
     
     def spend_funds(self, amount: float, purpose: str = "expense") -> bool:
         """
@@ -79,7 +153,7 @@ class ResourceManager:
         if self._funds >= amount:
             self._funds -= amount
             self._daily_costs += amount
-            print(f"💰 Spent ${amount:.2f} on {purpose}. Remaining: ${self._funds:.2f}")
+            logger.debug("💰 Spent $%.2f on %s. Remaining: $%.2f", amount, purpose, self._funds)
             return True
         else:
             raise FinancialError(
@@ -101,7 +175,7 @@ class ResourceManager:
         
         self._funds += amount
         self._daily_income += amount
-        print(f"💰 Added ${amount:.2f} from {source}. Total: ${self._funds:.2f}")
+        logger.debug("💰 Added $%.2f from %s. Total: $%.2f", amount, source, self._funds)
     
     def use_food(self, food_type: str, amount: float) -> bool:
         """
@@ -114,17 +188,23 @@ class ResourceManager:
         Returns:
             True if successful, False otherwise
         """
-        if food_type not in self._food_supply:
-            raise ResourceError(f"Unknown food type: {food_type}")
-        
-        if self._food_supply[food_type] >= amount:
-            self._food_supply[food_type] -= amount
-            return True
-        else:
+        idx, name = self._food_key(food_type)
+        if idx is None and name not in self._extra_food:
+            raise ResourceError(f"Unknown food type: {name}")
+
+        available = float(self._food_supply[idx]) if idx is not None else self._extra_food[name]
+        if available < amount:
             raise ResourceError(
-                f"Insufficient {food_type}. Available: {self._food_supply[food_type]:.1f}kg, "
+                f"Insufficient {name}. Available: {available:.1f}kg, "
                 f"Required: {amount:.1f}kg"
             )
+
+        if idx is not None:
+            self._food_supply[idx] = available - amount
+        else:
+            self._extra_food[name] = available - amount
+        self._food_view = None
+        return True
     
     def use_medicine(self, medicine_type: str, quantity: int = 1) -> bool:
         """
@@ -137,17 +217,23 @@ class ResourceManager:
         Returns:
             True if successful, False otherwise
         """
-        if medicine_type not in self._medicine_supply:
-            raise ResourceError(f"Unknown medicine type: {medicine_type}")
-        
-        if self._medicine_supply[medicine_type] >= quantity:
-            self._medicine_supply[medicine_type] -= quantity
-            return True
-        else:
+        idx, name = self._medicine_key(medicine_type)
+        if idx is None and name not in self._extra_medicine:
+            raise ResourceError(f"Unknown medicine type: {name}")
+
+        available = int(self._medicine_supply[idx]) if idx is not None else self._extra_medicine[name]
+        if available < quantity:
             raise ResourceError(
-                f"Insufficient {medicine_type}. Available: {self._medicine_supply[medicine_type]}, "
+                f"Insufficient {name}. Available: {available}, "
                 f"Required: {quantity}"
             )
+
+        if idx is not None:
+            self._medicine_supply[idx] = available - quantity
+        else:
+            self._extra_medicine[name] = available - quantity
+        self._medicine_view = None
+        return True
     
     def order_food(self, food_type: str, amount: float, cost_per_kg: float) -> bool:
         """
@@ -161,21 +247,25 @@ class ResourceManager:
         Returns:
             True if successful
         """
+        idx, name = self._food_key(food_type)
         total_cost = amount * cost_per_kg
-        
+
         try:
-            self.spend_funds(total_cost, f"ordering {amount}kg of {food_type}")
-            
-            if food_type in self._food_supply:
-                self._food_supply[food_type] += amount
+            self.spend_funds(total_cost, f"ordering {amount}kg of {name}")
+
+            if idx is not None:
+                self._food_supply[idx] += amount
+                new_supply = float(self._food_supply[idx])
             else:
-                self._food_supply[food_type] = amount
-            
-            print(f"📦 Ordered {amount}kg of {food_type}. New supply: {self._food_supply[food_type]:.1f}kg")
+                new_supply = self._extra_food.get(name, 0.0) + amount
+                self._extra_food[name] = new_supply
+            self._food_view = None
+
+            logger.debug("📦 Ordered %skg of %s. New supply: %.1fkg", amount, name, new_supply)
             return True
-            
+
         except FinancialError as e:
-            print(f"❌ Failed to order {food_type}: {e}")
+            logger.warning("❌ Failed to order %s: %s", name, e)
             return False
     
     def order_medicine(self, medicine_type: str, quantity: int, cost_per_unit: float) -> bool:
@@ -190,21 +280,25 @@ class ResourceManager:
         Returns:
             True if successful
         """
+        idx, name = self._medicine_key(medicine_type)
         total_cost = quantity * cost_per_unit
-        
+
         try:
-            self.spend_funds(total_cost, f"ordering {quantity} units of {medicine_type}")
-            
-            if medicine_type in self._medicine_supply:
-                self._medicine_supply[medicine_type] += quantity
+            self.spend_funds(total_cost, f"ordering {quantity} units of {name}")
+
+            if idx is not None:
+                self._medicine_supply[idx] += quantity
+                new_supply = int(self._medicine_supply[idx])
             else:
-                self._medicine_supply[medicine_type] = quantity
-            
-            print(f"💊 Ordered {quantity} units of {medicine_type}. New supply: {self._medicine_supply[medicine_type]}")
+                new_supply = self._extra_medicine.get(name, 0) + quantity
+                self._extra_medicine[name] = new_supply
+            self._medicine_view = None
+
+            logger.debug("💊 Ordered %s units of %s. New supply: %s", quantity, name, new_supply)
             return True
-            
+
         except FinancialError as e:
-            print(f"❌ Failed to order {medicine_type}: {e}")
+            logger.warning("❌ Failed to order %s: %s", name, e)
             return False
     
     def get_resource_status(self) -> Dict:
@@ -218,8 +312,9 @@ class ResourceManager:
             'funds': self._funds,
             'daily_costs': self._daily_costs,
             'daily_income': self._daily_income,
-            'food_supply': self._food_supply.copy(),
-            'medicine_supply': self._medicine_supply.copy()
+            # Plain dicts here: status snapshots get serialized (JSON, caching)
+            'food_supply': dict(self.food_supply),
+            'medicine_supply': dict(self.medicine_supply)
         }
     
     def reset_daily_stats(self) -> None:
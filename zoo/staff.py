@@ -11,7 +11,10 @@ class Staff:
     Relationships:
         - Parent class for Zookeeper, etc.
     """
-    
+
+    __slots__ = ('_name', '_role', '_salary', '_is_working')
+
+
     def __init__(self, name: str, role: str, salary: float):
         """Initialize staff member with basic information."""
         self._name = name
@@ -35,7 +38,10 @@ class Zookeeper(Staff):
         - Inherits from Staff
         - Interacts with Animals and Enclosures
     """
-    
+
+    __slots__ = ('_specialization',)
+
+
     def __init__(self, name: str, salary: float, specialization: str = "general"):
         """Initialize zookeeper with specialization."""
         super().__init__(name, "Zookeeper", salary)
@@ -7,8 +7,16 @@ from zoo.enclosure import Enclosure
 from zoo.resource_manager import ResourceManager
 from animals.animal import Animal
 from typing import List, Optional, Dict
+import logging
 import random
 
+try:
+    import numpy as np
+except ImportError:  # pragma: no cover - numpy is in requirements.txt
+    np = None
+
+logger = logging.getLogger(__name__)
+
 class Zoo:
     """
     Main zoo class managing all enclosures, staff, and operations.
@@ -21,7 +29,13 @@ class Zoo:
         _total_visitors (int): Total visitors since opening
         _days_operational (int): Days zoo has been open
     """
-    
+
+    __slots__ = ('_name', '_enclosures', '_enclosures_by_key',
+                 '_dirty_enclosures', '_animal_count', '_resource_manager',
+                 '_visitors_today', '_total_visitors', '_days_operational',
+                 '_ticket_price', '_rng')
+
+
     def __init__(self, name: str, initial_funds: float = 100000.0):
         """
         Initialize zoo with name and resources.
@@ -32,12 +46,20 @@ class Zoo:
         """
         self._name = name
         self._enclosures = []
+        # Name index (lowercased keys) for O(1) lookups; the list keeps
+        # the stable iteration order for daily updates and status
+        self._enclosures_by_key: Dict[str, Enclosure] = {}
+        self._dirty_enclosures = set()
+        self._animal_count = 0
         self._resource_manager = ResourceManager(initial_funds)
         self._visitors_today = 0
         self._total_visitors = 0
         self._days_operational = 0
         self._ticket_price = 25.0
-    
+        # Batches the daily random draws in one call (None without numpy)
+        self._rng = np.random.default_rng() if np is not None else None
+
+
     @property
     def name(self) -> str:
         """Get zoo name."""
@@ -59,11 +81,18 @@ class Zoo:
             True if successful
         """
         # Check if enclosure with same name exists
-        if any(e.name == enclosure.name for e in self._enclosures):
+        key = enclosure._name_key
+        if key in self._enclosures_by_key:
             raise EnclosureError(f"Enclosure with name '{enclosure.name}' already exists")
-        
+
         self._enclosures.append(enclosure)
-        print(f"🏠 Added enclosure '{enclosure.name}' to {self._name}")
+        self._enclosures_by_key[key] = enclosure
+        enclosure._dirty_callback = self._on_dirty_change
+        enclosure._count_callback = self._on_count_change
+        self._animal_count += enclosure.animal_count
+        if enclosure.needs_cleaning():
+            self._dirty_enclosures.add(enclosure)
+        logger.debug("🏠 Added enclosure '%s' to %s", enclosure.name, self._name)
         return True
     
     def remove_enclosure(self, enclosure_name: str) -> bool:
@@ -76,18 +105,24 @@ class Zoo:
         Returns:
             True if successful, False if not found
         """
-        for i, enclosure in enumerate(self._enclosures):
-            if enclosure.name == enclosure_name:
-                if enclosure.animal_count > 0:
-                    raise EnclosureError(
-                        f"Cannot remove enclosure '{enclosure_name}' with {enclosure.animal_count} animals"
-                    )
-                
-                removed_enclosure = self._enclosures.pop(i)
-                print(f"🗑️  Removed enclosure '{removed_enclosure.name}' from {self._name}")
-                return True
-        
-        return False
+        key = enclosure_name.lower()
+        enclosure = self._enclosures_by_key.get(key)
+        if enclosure is None:
+            return False
+
+        if enclosure.animal_count > 0:
+            raise EnclosureError(
+                f"Cannot remove enclosure '{enclosure_name}' with {enclosure.animal_count} animals"
+            )
+
+        del self._enclosures_by_key[key]
+        self._enclosures.remove(enclosure)
+        enclosure._dirty_callback = None
+        enclosure._count_callback = None
+        self._animal_count -= enclosure.animal_count
+        self._dirty_enclosures.discard(enclosure)
+        logger.debug("🗑️  Removed enclosure '%s' from %s", enclosure.name, self._name)
+        return True
     
     def add_animal(self, animal: Animal, enclosure_name: str) -> bool:
         """
@@ -100,19 +135,19 @@ class Zoo:
         Returns:
             True if successful
         """
-        print(f"🐾 Attempting to add {animal.name} the {animal.species} to {enclosure_name}")
+        logger.debug("🐾 Attempting to add %s the %s to %s", animal.name, animal.species, enclosure_name)
         
         enclosure = self._find_enclosure(enclosure_name)
         if enclosure:
             try:
                 result = enclosure.add_animal(animal)
-                print(f"✅ Successfully added {animal.name} to {enclosure_name}")
+                logger.debug("✅ Successfully added %s to %s", animal.name, enclosure_name)
                 return result
             except Exception as e:
-                print(f"❌ Failed to add {animal.name} to {enclosure_name}: {e}")
+                logger.warning("❌ Failed to add %s to %s: %s", animal.name, enclosure_name, e)
                 return False
         else:
-            print(f"❌ Enclosure '{enclosure_name}' not found")
+            logger.warning("❌ Enclosure '%s' not found", enclosure_name)
             return False
     
     def feed_animals(self, enclosure_name: Optional[str] = None) -> Dict:
@@ -130,58 +165,38 @@ class Zoo:
         if enclosure_name:
             enclosure = self._find_enclosure(enclosure_name)
             if enclosure:
-                # Determine appropriate food type based on animals
-                food_type = self._determine_food_type(enclosure.animals)
-                results[enclosure_name] = enclosure.feed_animals(food_type, self._resource_manager)
+                # Food type is maintained by the enclosure as animals come and go
+                results[enclosure_name] = enclosure.feed_animals(
+                    enclosure.dominant_food, self._resource_manager
+                )
             else:
                 raise EnclosureError(f"Enclosure '{enclosure_name}' not found")
         else:
             # Feed all enclosures
             for enclosure in self._enclosures:
-                food_type = self._determine_food_type(enclosure.animals)
-                results[enclosure.name] = enclosure.feed_animals(food_type, self._resource_manager)
-        
+                results[enclosure.name] = enclosure.feed_animals(
+                    enclosure.dominant_food, self._resource_manager
+                )
+
         return results
     
-    def _determine_food_type(self, animals: List[Animal]) -> str:
-        """
-        Determine appropriate food type for a group of animals.
-        
-        Args:
-            animals: List of animals
-            
-        Returns:
-            Appropriate food type
-        """
-        if not animals:
-            return "seeds"  # Default
-        
-        # Count diet types
-        diet_counts = {}
-        for animal in animals:
-            diet = animal.diet.value
-            diet_counts[diet] = diet_counts.get(diet, 0) + 1
-        
-        # Return most common diet type's preferred food
-        if diet_counts.get('carnivore', 0) > 0:
-            return "meat"
-        elif diet_counts.get('herbivore', 0) > 0:
-            return "vegetables"
-        else:
-            return "seeds"  # Default for omnivores or unknown
-    
     def daily_update(self) -> None:
         """
         Perform daily zoo operations and updates.
         """
-        print(f"\n=== DAY {self._days_operational + 1} UPDATE FOR {self._name.upper()} ===")
+        logger.debug("=== DAY %s UPDATE FOR %s ===", self._days_operational + 1, self._name.upper())
         
         # Simulate visitors
         self._simulate_visitors()
         
-        # Update all enclosures
-        for enclosure in self._enclosures:
-            enclosure.update_daily_status()
+        # Update all enclosures, pregenerating their dirt rates in one draw
+        if self._rng is not None and self._enclosures:
+            dirt = self._rng.uniform(2.0, 8.0, len(self._enclosures))
+            for i, enclosure in enumerate(self._enclosures):
+                enclosure.update_daily_status(dirt=float(dirt[i]))
+        else:
+            for enclosure in self._enclosures:
+                enclosure.update_daily_status()
         
         # Pay daily operating costs
         self._pay_operating_costs()
@@ -192,13 +207,16 @@ class Zoo:
         self._days_operational += 1
         self._visitors_today = 0  # Reset for next day
         
-        print(f"✅ Day {self._days_operational} completed!")
+        logger.debug("✅ Day %s completed!", self._days_operational)
     
     def _simulate_visitors(self) -> None:
         """Simulate daily visitor attendance and income."""
         # Base visitors with some randomness
         base_visitors = 100
-        random_factor = random.randint(-20, 50)
+        if self._rng is not None:
+            random_factor = int(self._rng.integers(-20, 51))
+        else:
+            random_factor = random.randint(-20, 50)
         animal_attraction = self.get_animal_count() * 2
         
         self._visitors_today = max(10, base_visitors + random_factor + animal_attraction)
@@ -208,43 +226,77 @@ class Zoo:
         daily_income = self._visitors_today * self._ticket_price
         self._resource_manager.add_funds(daily_income, "ticket sales")
         
-        print(f"🎟️  {self._visitors_today} visitors today (${daily_income:.2f} income)")
+        logger.debug("🎟️  %s visitors today ($%.2f income)", self._visitors_today, daily_income)
     
-    def _pay_operating_costs(self) -> None:
-        """Pay daily operating costs."""
+    def _calc_daily_costs(self) -> Dict[str, float]:
+        """
+        Compute the daily cost breakdown in one place.
+
+        Returns:
+            Dictionary with cost breakdown
+        """
         base_cost = 500.0  # Fixed daily costs
         animal_cost = self.get_animal_count() * 10.0  # Per animal cost
         enclosure_cost = len(self._enclosures) * 50.0  # Per enclosure cost
-        
-        total_cost = base_cost + animal_cost + enclosure_cost
-        
+        return {
+            'daily_operations': base_cost,
+            'per_animal': animal_cost,
+            'per_enclosure': enclosure_cost,
+            'total_daily': base_cost + animal_cost + enclosure_cost
+        }
+
+    def _pay_operating_costs(self) -> None:
+        """Pay daily operating costs."""
+        total_cost = self._calc_daily_costs()['total_daily']
+
         try:
             self._resource_manager.spend_funds(total_cost, "daily operations")
         except FinancialError as e:
-            print(f"⚠️  Warning: Could not pay full operating costs: {e}")
-    
+            logger.warning("⚠️  Could not pay full operating costs: %s", e)
+
     def calculate_costs(self) -> Dict[str, float]:
         """
         Calculate various zoo costs.
-        
+
         Returns:
             Dictionary with cost breakdown
         """
-        return {
-            'daily_operations': 500.0,
-            'per_animal': self.get_animal_count() * 10.0,
-            'per_enclosure': len(self._enclosures) * 50.0,
-            'total_daily': 500.0 + (self.get_animal_count() * 10.0) + (len(self._enclosures) * 50.0)
-        }
+        return self._calc_daily_costs()
     
+    def _on_dirty_change(self, enclosure: Enclosure, is_dirty: bool) -> None:
+        """Callback from enclosures when their dirty state flips."""
+        if is_dirty:
+            self._dirty_enclosures.add(enclosure)
+        else:
+            self._dirty_enclosures.discard(enclosure)
+
+    def get_dirty_enclosures(self) -> List[Enclosure]:
+        """
+        Get enclosures currently needing cleaning.
+
+        The set is maintained incrementally by the cleanliness setter,
+        so this is O(dirty) rather than a scan over every enclosure.
+
+        Returns:
+            Dirty enclosures, ordered by name
+        """
+        return sorted(self._dirty_enclosures, key=lambda e: e.name)
+
+    def _on_count_change(self, delta: int) -> None:
+        """Callback from enclosures when animals are added or removed."""
+        self._animal_count += delta
+
     def get_animal_count(self) -> int:
         """
         Get total number of animals in zoo.
-        
+
+        Maintained incrementally via enclosure callbacks, so this is
+        O(1) instead of summing over every enclosure per call.
+
         Returns:
             Total animal count
         """
-        return sum(enclosure.animal_count for enclosure in self._enclosures)
+        return self._animal_count
     
     def _find_enclosure(self, enclosure_name: str) -> Optional[Enclosure]:
         """
@@ -256,10 +308,7 @@ class Zoo:
         Returns:
             Enclosure or None if not found
         """
-        for enclosure in self._enclosures:
-            if enclosure.name.lower() == enclosure_name.lower():
-                return enclosure
-        return None
+        return self._enclosures_by_key.get(enclosure_name.lower())
     
     def get_zoo_status(self) -> Dict:
         """
@@ -291,7 +340,7 @@ class Zoo:
         """
         Order basic supplies to replenish stocks.
         """
-        print("\n📦 Ordering basic supplies...")
+        logger.debug("📦 Ordering basic supplies...")
         
         # Order food
         self._resource_manager.order_food("meat", 50.0, 8.0)      # $8/kg